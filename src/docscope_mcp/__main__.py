@@ -0,0 +1,12 @@
+"""
+Run the DocScope MCP server with ``python -m docscope_mcp``.
+
+Imports the server as a regular package module, so its cached bytecode
+is used and spawned analysis workers re-import only this small stub as
+their main module.
+"""
+
+from docscope_mcp.server import serve
+
+if __name__ == "__main__":  # pragma: no cover
+    serve()
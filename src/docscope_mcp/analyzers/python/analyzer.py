@@ -15,6 +15,7 @@ import ast
 import logging
 import re
 import signal
+from operator import itemgetter
 from typing import Any, Literal, cast
 
 from docscope_mcp.models import (
@@ -26,11 +27,15 @@ from docscope_mcp.models import (
     QualityIndicators,
     QualityLevel,
 )
+from docscope_mcp.models.quality import INDICATOR_LABELS, classify_score
 
 # Pre-compiled regex patterns for performance
 REGEX_TEST_CAMELCASE = re.compile(r"test_[A-Z]")
 REGEX_BRIEF_DESCRIPTION = re.compile(r"^\s*[A-Z][^.]*\.$")
 
+# C-level sort key for priority ordering
+_PRIORITY_KEY = itemgetter("priority")
+
 
 class PythonAnalyzer:
     """Python documentation quality analyzer using AST parsing.
@@ -146,14 +151,43 @@ class PythonAnalyzer:
             parse_result = self._parse_with_timeout(code)
             if isinstance(parse_result, dict):
                 return [parse_result]
+        except Exception as e:
+            return [{"error": f"Failed to analyze code: {e!s}"}]
+
+        return self.analyze_ast(parse_result, file_path)
+
+    def analyze_ast(self, tree: ast.AST, file_path: str = "") -> list[dict[str, Any]]:
+        """Analyze an already-parsed Python module.
+
+        Runs the post-parse half of analyze() so callers holding a tree
+        (or analyzing the same source repeatedly) skip ast.parse. Code
+        size and path checks apply to source text and are not repeated;
+        the AST depth limit is still enforced.
+
+        Args:
+            tree: Parsed module, e.g. from ast.parse(code).
+            file_path: Optional file path for context in results.
+
+        Returns:
+            Same prioritized list as analyze(), or [{"error": "message"}]
+            on failure.
+
+        Raises:
+            No exceptions raised - errors returned in result list.
 
+        Example:
+            >>> tree = ast.parse('def foo(): pass')
+            >>> PythonAnalyzer().analyze_ast(tree, 'example.py')[0]['function_name']
+            'foo'
+        """
+        try:
             # Depth validation
-            depth_error = self._validate_ast_depth(parse_result)
+            depth_error = self._validate_ast_depth(tree)
             if depth_error:
                 return [depth_error]
 
             # Extract and analyze functions
-            functions = self._extract_functions_needing_improvement(parse_result, file_path)
+            functions = self._extract_functions_needing_improvement(tree, file_path)
 
             # Sort by priority
             return self._sort_by_priority(functions)
@@ -223,33 +257,22 @@ class PythonAnalyzer:
         # Validate Args/Returns against signature
         quality_indicators = self._validate_signature_coverage(quality_indicators, func_info)
 
-        # Calculate score
-        indicator_values = list(quality_indicators.values())
-        score = sum(cast(list[bool], indicator_values)) / len(indicator_values)
-
-        # Identify missing elements
-        missing = [key.replace("_", " ") for key, value in quality_indicators.items() if not value]
+        # Identify missing elements and derive score in a single pass
+        missing = [INDICATOR_LABELS[key] for key, value in quality_indicators.items() if not value]
+        total = len(quality_indicators)
+        score = (total - len(missing)) / total
 
         # Determine quality level
-        thresholds = self.config.quality_thresholds
         quality_str: Literal["poor", "basic", "good", "excellent"]
 
         if is_brief:
             quality_str = "poor"
             needs_improvement = True
             missing.insert(0, "comprehensive content (too brief)")
-        elif score >= thresholds["excellent"]:
-            quality_str = "excellent"
-            needs_improvement = False
-        elif score >= thresholds["good"]:
-            quality_str = "good"
-            needs_improvement = True
-        elif score >= thresholds["basic"]:
-            quality_str = "basic"
-            needs_improvement = True
         else:
-            quality_str = "poor"
-            needs_improvement = True
+            level = classify_score(score, self.config.score_cutoffs)
+            quality_str = level.value
+            needs_improvement = level is not QualityLevel.EXCELLENT
 
         return {
             "quality": quality_str,
@@ -367,7 +390,7 @@ class PythonAnalyzer:
             raise ValueError("file_path contains null byte")
 
         if "../" in file_path or "..\\" in file_path:
-            self.logger.warning(f"Path traversal pattern detected: {file_path[:100]}")
+            self.logger.warning("Path traversal pattern detected: %.100s", file_path)
 
     def _parse_with_timeout(self, code: str) -> ast.AST | dict[str, str]:
         """Parse Python code with timeout protection.
@@ -660,13 +683,14 @@ class PythonAnalyzer:
 
         Orders analysis results so highest priority (most urgent)
         functions appear first. Provides actionable ordering for
-        MCP tool output.
+        MCP tool output. Sorts in place with a C-level itemgetter key;
+        the stable sort keeps source order among equal priorities.
 
         Args:
             functions: List of function analysis dicts.
 
         Returns:
-            Same list sorted by priority (highest first).
+            The input list, sorted in place by priority (highest first).
 
         Raises:
             KeyError: If function dict missing 'priority' key.
@@ -676,7 +700,8 @@ class PythonAnalyzer:
             >>> sorted_funcs[0]['priority'] >= sorted_funcs[-1]['priority']
             True
         """
-        return sorted(functions, key=lambda x: x["priority"], reverse=True)
+        functions.sort(key=_PRIORITY_KEY, reverse=True)
+        return functions
 
     # ==================== TEST DETECTION ====================
 
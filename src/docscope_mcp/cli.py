@@ -326,7 +326,7 @@ def uninstall_mcp(global_install: bool = False, insiders: bool = False) -> int:
     return 0
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """CLI entry point for docscope-mcp commands.
 
     Parses command-line arguments and dispatches to install/uninstall
@@ -341,7 +341,8 @@ def main() -> int:
         --version, -v: Show version and exit
 
     Args:
-        None - reads from sys.argv.
+        argv: Arguments excluding the program name. Defaults to
+            sys.argv[1:] when None.
 
     Returns:
         Exit code: 0 for success, non-zero for failure.
@@ -351,9 +352,7 @@ def main() -> int:
 
     Example:
         >>> # Programmatic usage:
-        >>> import sys
-        >>> sys.argv = ['docscope-mcp', 'install']
-        >>> exit_code = main()
+        >>> exit_code = main(['install'])
         >>> exit_code == 0
         True
     """
@@ -399,7 +398,7 @@ def main() -> int:
         help="Use VS Code Insiders config path (only with --global)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command == "install":
         if args.insiders and not args.global_install:
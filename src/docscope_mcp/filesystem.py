@@ -24,9 +24,17 @@ Usage:
     ```
 """
 
+import errno
+import fnmatch
+import functools
 import json
 import os
+import re
 import shutil
+import stat
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
 from typing import Any, Protocol, cast
 
@@ -34,6 +42,410 @@ from typing import Any, Protocol, cast
 type JSONValue = dict[str, "JSONValue"] | list["JSONValue"] | str | int | float | bool | None
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a shell-style glob pattern to a cached regex.
+
+    Glob patterns repeat heavily across calls ('*.py', '**/*.md'), so
+    the fnmatch.translate + re.compile step is paid once per unique
+    pattern instead of once per call or per candidate path.
+
+    Args:
+        pattern: Shell-style pattern (*, ?, [seq]).
+
+    Returns:
+        Compiled regex; use .match() against the candidate string.
+
+    Raises:
+        re.error: If the translated pattern is not a valid regex.
+
+    Example:
+        >>> _compile_glob('*.py').match('module.py') is not None
+        True
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+
+# Characters that make a glob component a pattern rather than a literal name
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
+
+@functools.lru_cache(maxsize=256)
+def _split_glob(pattern: str) -> tuple[str, ...]:
+    """Split a glob pattern into path components once per unique pattern.
+
+    Normalizes separators, drops empty and '.' components, and collapses
+    consecutive '**' so the scandir walker never re-walks the same tree.
+    A trailing separator is kept as a final '' component, which restricts
+    matches to directories as in Path.glob.
+
+    Args:
+        pattern: Relative glob pattern (e.g., '**/*.py').
+
+    Returns:
+        Tuple of pattern components.
+
+    Raises:
+        ValueError: If pattern is empty or absolute.
+
+    Example:
+        >>> _split_glob('src/**/**/*.py')
+        ('src', '**', '*.py')
+        >>> _split_glob('*/')
+        ('*', '')
+    """
+    if not pattern or os.path.isabs(pattern):
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+
+    parts: list[str] = []
+    for part in pattern.replace(os.sep, "/").split("/"):
+        if part in ("", ".") or (part == "**" and parts and parts[-1] == "**"):
+            continue
+        parts.append(part)
+
+    if not parts:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+    if pattern.endswith(("/", os.sep)):
+        parts.append("")
+    return tuple(parts)
+
+
+def _scandir_entries(path: str) -> list[os.DirEntry[str]]:
+    """List directory entries, treating unreadable directories as empty.
+
+    Materializes the scandir iterator so the directory handle is closed
+    before the walker recurses, keeping open descriptors bounded.
+
+    Args:
+        path: Directory to list.
+
+    Returns:
+        DirEntry objects with cached type information.
+
+    Raises:
+        No exceptions - OSError yields an empty list, matching Path.glob.
+
+    Example:
+        >>> names = [e.name for e in _scandir_entries('.')]
+    """
+    try:
+        with os.scandir(path) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+
+def _scandir_glob(base: str, parts: tuple[str, ...]) -> Iterator[str]:
+    """Yield paths under base matching pre-split glob components.
+
+    Walks with os.scandir and reuses each DirEntry's cached d_type for
+    is_dir checks, avoiding the per-child stat that Path.glob issues.
+    '**' matches zero or more directories without following symlinks;
+    a trailing '**' yields files and directories, as in Python 3.13. A
+    final '' component (trailing separator) yields only directories:
+    callers only descend into directories, so base is yielded as is.
+
+    Args:
+        base: Directory string to search from.
+        parts: Components from _split_glob (must be non-empty).
+
+    Returns:
+        Iterator of matching path strings.
+
+    Raises:
+        No exceptions - unreadable directories are skipped.
+
+    Example:
+        >>> list(_scandir_glob('src', ('*.py',)))  # ['src/a.py', ...]
+    """
+    part, rest = parts[0], parts[1:]
+
+    if not part:
+        yield base
+        return
+
+    if part == "**":
+        if rest:
+            yield from _scandir_glob(base, rest)
+        else:
+            yield base
+        for entry in _scandir_entries(base):
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_glob(entry.path, parts)
+            elif not rest:
+                yield entry.path
+        return
+
+    if not _GLOB_MAGIC.search(part):
+        candidate = os.path.join(base, part)
+        if rest:
+            if os.path.isdir(candidate):
+                yield from _scandir_glob(candidate, rest)
+        elif os.path.lexists(candidate):
+            yield candidate
+        return
+
+    match = _compile_glob(part).match
+    for entry in _scandir_entries(base):
+        if match(entry.name):
+            if not rest:
+                yield entry.path
+            elif entry.is_dir():
+                yield from _scandir_glob(entry.path, rest)
+
+
+# Batches smaller than this run serially; thread pool startup would dominate
+_BATCH_POOL_MIN = 16
+
+
+def _map_batch[A, T](func: Callable[[A], T], items: list[A]) -> list[T]:
+    """Apply an I/O-bound function to items, threading large batches.
+
+    Backs the *_batch adapter methods and copy_files(). Filesystem
+    syscalls release the GIL, so a thread pool overlaps them; results
+    keep input order and the first exception propagates as it would in
+    a serial loop.
+
+    Args:
+        func: Per-item operation (e.g., os.path.exists).
+        items: Paths (or path pairs) to process.
+
+    Returns:
+        Results of func for each item, in input order.
+
+    Raises:
+        Any exception raised by func for the first failing item.
+
+    Example:
+        >>> _map_batch(os.path.exists, [Path('.')])
+        [True]
+    """
+    if len(items) < _BATCH_POOL_MIN:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(32, len(items))) as pool:
+        return list(pool.map(func, items))
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_cached(path: Path) -> Path:
+    """Resolve a workspace root once and reuse the canonical path.
+
+    A long-running MCP server validates against the same workspace on
+    every request; memoizing its resolve() removes one realpath chain
+    per validation. Only used for workspace roots, never for user paths.
+    Callers pass an absolute path so a relative workspace is not pinned
+    to the working directory of its first use.
+
+    Args:
+        path: Absolute workspace root directory.
+
+    Returns:
+        Absolute canonical path with symlinks resolved.
+
+    Raises:
+        No exceptions - returns path even if target missing.
+
+    Example:
+        >>> _resolve_cached(Path('/project'))
+        PosixPath('/project')
+    """
+    return path.resolve()
+
+
+def _read_fd(fd: int) -> bytes:
+    """Read an open descriptor to EOF with one fstat and usually one read.
+
+    Sizes the read from fstat on the already-open descriptor rather than
+    stat()-ing the path first, and skips the buffered file object that
+    Path.read_bytes() builds. Requesting one byte more than the reported
+    size detects EOF without a second read; files that grow or report a
+    zero size (procfs) fall back to reading until EOF. Always closes fd.
+
+    Args:
+        fd: Descriptor opened for reading; ownership passes to this call.
+
+    Returns:
+        Complete file content.
+
+    Raises:
+        IsADirectoryError: If fd refers to a directory.
+
+    Example:
+        >>> _read_fd(os.open('pyproject.toml', os.O_RDONLY))[:9]
+        b'[project]'
+    """
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        if len(data) <= size:
+            return data
+        chunks = [data]
+        while chunk := os.read(fd, max(size, 8192)):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _read_file_bytes(path: Path) -> bytes:
+    """Read a whole file with one open, one fstat and usually one read.
+
+    Args:
+        path: Path to file.
+
+    Returns:
+        Complete file content.
+
+    Raises:
+        FileNotFoundError: If path does not exist.
+        IsADirectoryError: If path is a directory.
+
+    Example:
+        >>> _read_file_bytes(Path('pyproject.toml'))[:9]
+        b'[project]'
+    """
+    return _read_fd(os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0)))
+
+
+# openat()-style anchored opens need dir_fd support plus the POSIX flags
+_ANCHORED_OPEN = os.open in os.supports_dir_fd and hasattr(os, "O_NOFOLLOW")
+
+
+# Symlinks followed by one anchored open before it fails with ELOOP
+_MAX_SYMLINK_HOPS = 40
+
+
+def _open_beneath(root_fd: int, root: str, parts: tuple[str, ...]) -> int:
+    """Open a file below a directory descriptor, confining symlinks to root.
+
+    Walks parts one component at a time with O_NOFOLLOW relative to the
+    previous directory descriptor, so the kernel never traverses a
+    symlink on its own. When a component is a symlink, its target is read
+    and spliced into the remaining path, and the walk restarts from
+    root_fd; '..' likewise steps back over already-opened directories.
+    A target or '..' leaving root is rejected, so nothing swapped in
+    after validation can redirect the open outside root_fd, while
+    symlinks that stay inside the workspace are followed. Intermediate
+    descriptors are always closed.
+
+    Args:
+        root_fd: Open directory descriptor the path is anchored to.
+        root: Real (symlink-free) path of root_fd, for absolute targets.
+        parts: Path components below root_fd; empty means root itself.
+
+    Returns:
+        Read-only descriptor for the final component.
+
+    Raises:
+        ValueError: If '..' or a symlink target leaves root.
+        FileNotFoundError: If a component does not exist.
+        OSError: With errno ELOOP after too many symlinks.
+
+    Example:
+        >>> fd = _open_beneath(ws_fd, '/ws', ('src', 'main.py'))
+    """
+    file_flags = os.O_RDONLY | os.O_NOFOLLOW | os.O_CLOEXEC
+    dir_flags = file_flags | os.O_DIRECTORY
+    pending = [part for part in parts if part not in ("", ".")]
+    hops = 0
+    while True:
+        walked: list[str] = []
+        fd = root_fd
+        try:
+            for index, part in enumerate(pending):
+                rest = pending[index + 1 :]
+                if part == "..":
+                    if not walked:
+                        raise ValueError(f"Path escapes workspace: {os.path.join(*pending)}")
+                    # walked holds real directories only, so '..' is lexical
+                    pending = walked[:-1] + rest
+                    break
+                try:
+                    next_fd = os.open(part, dir_flags if rest else file_flags, dir_fd=fd)
+                except OSError as exc:
+                    # O_NOFOLLOW reports a symlink as ELOOP, or ENOTDIR with O_DIRECTORY
+                    if exc.errno not in (errno.ELOOP, errno.ENOTDIR) or not stat.S_ISLNK(
+                        os.stat(part, dir_fd=fd, follow_symlinks=False).st_mode
+                    ):
+                        raise
+                    hops += 1
+                    if hops > _MAX_SYMLINK_HOPS:
+                        raise OSError(errno.ELOOP, os.strerror(errno.ELOOP), part) from None
+                    target = os.readlink(part, dir_fd=fd)
+                    if os.path.isabs(target):
+                        target = os.path.normpath(target)
+                        if target != root and not target.startswith(root.rstrip(os.sep) + os.sep):
+                            target = os.path.realpath(target)
+                        if target != root and not target.startswith(root.rstrip(os.sep) + os.sep):
+                            msg = f"Symlink target escapes workspace: {part} -> {target}"
+                            raise ValueError(msg) from None
+                        base = os.path.relpath(target, root).split(os.sep)
+                    else:
+                        base = walked + target.split(os.sep)
+                    pending = [p for p in base if p not in ("", ".")] + rest
+                    break
+                if not rest:
+                    return next_fd
+                if fd != root_fd:
+                    os.close(fd)
+                fd = next_fd
+                walked.append(part)
+            else:
+                return os.open(".", file_flags, dir_fd=root_fd)
+        finally:
+            if fd != root_fd:
+                os.close(fd)
+
+
+# Pre-encoded JSON literals for the shallow write_json fast path
+_JSON_LITERALS: dict[object, str] = {True: "true", False: "false", None: "null"}
+
+
+def _fast_encode_shallow(data: dict[str, Any]) -> bytes | None:
+    """Encode a flat dict as 2-space indented JSON without JSONEncoder.
+
+    Specialized writer for small config snapshots whose values are all
+    str, int, bool, or None. Output is byte-identical to
+    ``json.dumps(data, indent=2)`` but skips the iterencode generator
+    machinery. Any other shape is rejected so callers fall back to json.
+
+    Args:
+        data: Dictionary to encode.
+
+    Returns:
+        UTF-8 (ASCII-escaped) JSON bytes, or None if data has non-str
+        keys or values other than str, int, bool, or None.
+
+    Raises:
+        No exceptions - unsupported input returns None.
+
+    Example:
+        >>> _fast_encode_shallow({'a': 1, 'b': True})
+        b'{\\n  "a": 1,\\n  "b": true\\n}'
+        >>> _fast_encode_shallow({'a': [1]}) is None
+        True
+    """
+    if not data:
+        return b"{}"
+
+    items = []
+    for key, value in data.items():
+        if type(key) is not str:
+            return None
+        value_type = type(value)
+        if value_type is str:
+            encoded = encode_basestring_ascii(value)
+        elif value_type is bool or value is None:
+            encoded = _JSON_LITERALS[value]
+        elif value_type is int:
+            encoded = int.__repr__(value)
+        else:
+            return None
+        items.append(f"  {encode_basestring_ascii(key)}: {encoded}")
+
+    return ("{\n" + ",\n".join(items) + "\n}").encode("ascii")
+
+
 class FilesystemAdapter(Protocol):
     """Protocol defining filesystem operations for dependency injection.
 
@@ -328,15 +740,105 @@ class FilesystemAdapter(Protocol):
         """
         ...
 
+    def exists_batch(self, paths: list[Path]) -> list[bool]:
+        """Check existence of many paths in one adapter call.
+
+        Batched form of exists() for loops over glob results. Amortizes
+        per-call overhead and lets implementations overlap the stat
+        syscalls. Results align positionally with the input list.
+
+        Args:
+            paths: Paths to check for existence.
+
+        Returns:
+            List of booleans, one per input path, in input order.
+
+        Raises:
+            No exceptions - inaccessible paths report False.
+
+        Example:
+            >>> fs.exists_batch([Path('a.json'), Path('missing.json')])
+            [True, False]
+        """
+        ...
+
+    def read_text_batch(self, paths: list[Path]) -> list[str]:
+        """Read many UTF-8 text files in one adapter call.
+
+        Batched form of read_text() for analysis tools that load every
+        file returned by glob. Implementations may read concurrently;
+        results align positionally with the input list.
+
+        Args:
+            paths: Paths to UTF-8 text files.
+
+        Returns:
+            List of file contents, one per input path, in input order.
+
+        Raises:
+            FileNotFoundError: If any path does not exist.
+            UnicodeDecodeError: If any file is not valid UTF-8.
+
+        Example:
+            >>> sources = fs.read_text_batch(fs.glob(Path('src'), '**/*.py'))
+        """
+        ...
+
+    def read_json_batch(self, paths: list[Path]) -> list[JSONValue]:
+        """Read and parse many JSON files in one adapter call.
+
+        Batched form of read_json() for loading sets of config or result
+        files. Results align positionally with the input list.
+
+        Args:
+            paths: Paths to JSON files.
+
+        Returns:
+            List of parsed JSON values, one per input path, in input order.
+
+        Raises:
+            FileNotFoundError: If any path does not exist.
+            json.JSONDecodeError: If any file contains invalid JSON.
+
+        Example:
+            >>> configs = fs.read_json_batch([Path('a.json'), Path('b.json')])
+        """
+        ...
+
+    def copy_files(self, pairs: list[tuple[Path, Path]]) -> None:
+        """Copy many files in one adapter call.
+
+        Batched form of copy_file() for installing a directory of
+        templates. Lets implementations create each destination parent
+        once and overlap the copies.
+
+        Args:
+            pairs: (src, dst) tuples; dst parents are created if missing.
+
+        Returns:
+            None - copies files as side effect.
+
+        Raises:
+            FileNotFoundError: If any src does not exist.
+            PermissionError: If any src unreadable or dst unwritable.
+
+        Example:
+            >>> fs.copy_files([(Path('t/a.md'), Path('docs/a.md'))])
+        """
+        ...
+
 
 class PathSecurityValidator:
     """Validates paths against workspace boundaries for security.
 
     Prevents path traversal attacks by ensuring user-provided paths
     cannot escape workspace boundaries. Uses FilesystemAdapter for
-    symlink operations to enable testability.
+    symlink operations to enable testability, or a per-workspace native
+    validator (see make_validator) when no adapter is given.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def validate_workspace_boundary(
         path: Path,
@@ -357,7 +859,7 @@ class PathSecurityValidator:
             path: User-provided path (absolute or relative).
             workspace: Workspace root directory boundary.
             fs: Optional FilesystemAdapter for symlink operations.
-                If None, uses Path methods directly.
+                If None, resolves natively with a single realpath.
 
         Returns:
             Validated absolute path safe to access.
@@ -375,34 +877,26 @@ class PathSecurityValidator:
             >>> str(safe).endswith('src/file.py')
             True
         """
+        if fs is None:
+            return PathSecurityValidator.make_validator(workspace)(path)
+
         if path.is_absolute():
             return path
 
-        full_path = workspace / path
-        workspace_resolved = workspace.resolve()
-
-        # Use adapter methods if provided, otherwise use Path methods
-        def is_symlink(p: Path) -> bool:
-            return fs.is_symlink(p) if fs else p.is_symlink()
+        workspace_resolved = _resolve_cached(workspace.absolute())
 
-        def readlink(p: Path) -> Path:
-            return fs.readlink(p) if fs else p.readlink()
-
-        def resolve(p: Path) -> Path:
-            return fs.resolve(p) if fs else p.resolve()
-
-        # Check symlinks in path
+        # Adapter-mediated walk: check each component for escaping symlinks
         current = workspace
         for part in path.parts:
             current = current / part
 
-            if is_symlink(current):
+            if fs.is_symlink(current):
                 try:
-                    target = readlink(current)
+                    target = fs.readlink(current)
                     if not target.is_absolute():
-                        target = resolve(current.parent / target)
+                        target = fs.resolve(current.parent / target)
                     else:
-                        target = resolve(target)
+                        target = fs.resolve(target)
 
                     try:
                         target.relative_to(workspace_resolved)
@@ -412,7 +906,7 @@ class PathSecurityValidator:
                 except OSError:
                     raise ValueError(f"Cannot validate symlink: {current}") from None
 
-        resolved = resolve(full_path)
+        resolved = fs.resolve(workspace / path)
 
         try:
             resolved.relative_to(workspace_resolved)
@@ -421,6 +915,80 @@ class PathSecurityValidator:
 
         return resolved
 
+    @staticmethod
+    def make_validator(workspace: Path) -> Callable[[Path], Path]:
+        """Build a validator specialized to one workspace.
+
+        Native fast path used when no adapter is supplied. The workspace
+        is resolved once and its root and separator-terminated prefix are
+        captured in the returned closure, so each call only joins, runs
+        os.path.realpath (which resolves every intermediate symlink in one
+        pass) and does a string prefix check. Validators are memoized per
+        absolute workspace, as an MCP server checks every request against
+        the same root; a relative workspace is made absolute against the
+        current directory first, so a later chdir selects a new validator.
+
+        Args:
+            workspace: Workspace root directory boundary.
+
+        Returns:
+            Callable taking a user-provided path and returning the
+            validated path, with validate_workspace_boundary() semantics.
+
+        Raises:
+            No exceptions raised - the returned callable raises ValueError
+            when a path escapes the workspace directly or via a symlink.
+
+        Example:
+            >>> validate = PathSecurityValidator.make_validator(Path('/project'))
+            >>> validate(Path('a.py'))
+            PosixPath('/project/a.py')
+        """
+        return _workspace_validator(os.path.abspath(workspace))
+
+
+@functools.lru_cache(maxsize=32)
+def _workspace_validator(workspace: str) -> Callable[[Path], Path]:
+    """Build and memoize the validator closure for an absolute workspace.
+
+    Keyed on the absolute workspace string so a relative workspace can
+    never reuse a root resolved under an earlier working directory.
+
+    Args:
+        workspace: Absolute workspace root (see os.path.abspath).
+
+    Returns:
+        Validator callable for PathSecurityValidator.make_validator.
+
+    Raises:
+        No exceptions raised - the returned callable raises ValueError
+        when a path escapes the workspace directly or via a symlink.
+
+    Example:
+        >>> _workspace_validator('/project')(Path('a.py'))
+        PosixPath('/project/a.py')
+    """
+    root = os.path.realpath(workspace)
+    prefix = root if root.endswith(os.sep) else root + os.sep
+    join, realpath, normpath = os.path.join, os.path.realpath, os.path.normpath
+
+    def validate(path: Path) -> Path:
+        if path.is_absolute():
+            return path
+        joined = join(root, path)
+        resolved = realpath(joined)
+        if resolved == root or resolved.startswith(prefix):
+            return Path(resolved)
+
+        # Lexically inside but resolved outside means a symlink escaped
+        lexical = normpath(joined)
+        if lexical == root or lexical.startswith(prefix):
+            msg = f"Symlink target escapes workspace: {path} -> {resolved}"
+            raise ValueError(msg)
+        raise ValueError(f"Path escapes workspace: {path} -> {resolved}")
+
+    return validate
+
 
 class DefaultFilesystemAdapter:  # pragma: no cover
     """Production filesystem adapter using Python stdlib.
@@ -433,8 +1001,15 @@ class DefaultFilesystemAdapter:  # pragma: no cover
     allowing MCP tools to be tested with MockFilesystemAdapter while
     using real I/O in production.
 
+    When constructed with a workspace on a platform supporting dir_fd,
+    read_text() and read_json() open files through a descriptor held on
+    the (realpath-resolved) workspace root, one component at a time with
+    O_NOFOLLOW; symlinks are followed only while their targets stay in
+    the root. This enforces containment at open time, closing the race
+    between validate_path() and the read.
+
     Attributes:
-        None - stateless adapter using stdlib functions.
+        None public - holds only the optional workspace anchor.
 
     Example:
         >>> fs = DefaultFilesystemAdapter()
@@ -442,6 +1017,89 @@ class DefaultFilesystemAdapter:  # pragma: no cover
         >>> fs.write_json(Path('config.json'), {'key': 'value'})
     """
 
+    __slots__ = ("_workspace", "_workspace_fd", "_workspace_lexical")
+
+    def __init__(self, workspace: Path | None = None) -> None:
+        """Initialize adapter, optionally anchoring reads to a workspace.
+
+        Args:
+            workspace: Root directory reads must stay within. None keeps
+                plain path-based reads.
+
+        Returns:
+            None - initializes instance attributes.
+
+        Raises:
+            FileNotFoundError: If workspace does not exist.
+            NotADirectoryError: If workspace is not a directory.
+
+        Example:
+            >>> fs = DefaultFilesystemAdapter(Path.cwd())
+        """
+        # Compare against the real root, as validate_path() returns
+        # realpath-resolved paths; keep the spelling given for callers
+        # that build paths from it through a symlinked ancestor
+        self._workspace = None if workspace is None else Path(os.path.realpath(workspace))
+        self._workspace_lexical = None if workspace is None else Path(os.path.abspath(workspace))
+        self._workspace_fd: int | None = None
+        if self._workspace is not None and _ANCHORED_OPEN:
+            self._workspace_fd = os.open(
+                self._workspace, os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC
+            )
+
+    def close(self) -> None:
+        """Release the workspace descriptor, if one is held.
+
+        Args:
+            None - uses implicit self.
+
+        Returns:
+            None - closes descriptor as side effect.
+
+        Raises:
+            No exceptions raised; safe to call repeatedly.
+
+        Example:
+            >>> fs.close()
+        """
+        if self._workspace_fd is not None:
+            os.close(self._workspace_fd)
+            self._workspace_fd = None
+
+    __del__ = close
+
+    def _read_bytes(self, path: Path) -> bytes:
+        """Read a file, anchored to the workspace descriptor when held.
+
+        Args:
+            path: File path. When anchored, an absolute path must lie
+                within the workspace (real or as given) and a relative
+                path is taken relative to the workspace.
+
+        Returns:
+            Complete file content.
+
+        Raises:
+            ValueError: If path, or a symlink along it, leaves the
+                workspace in anchored mode.
+            FileNotFoundError: If path does not exist.
+
+        Example:
+            >>> fs._read_bytes(Path('/ws/src/main.py'))
+        """
+        if self._workspace_fd is None:
+            return _read_file_bytes(path)
+        root = cast(Path, self._workspace)
+        if not path.is_absolute():
+            parts = path.parts
+        elif path.is_relative_to(root):
+            parts = path.relative_to(root).parts
+        elif path.is_relative_to(cast(Path, self._workspace_lexical)):
+            parts = path.relative_to(cast(Path, self._workspace_lexical)).parts
+        else:
+            raise ValueError(f"Path escapes workspace: {path}")
+        return _read_fd(_open_beneath(self._workspace_fd, str(root), parts))
+
     def __repr__(self) -> str:
         """Return string representation for debugging.
 
@@ -452,7 +1110,8 @@ class DefaultFilesystemAdapter:  # pragma: no cover
             None - uses implicit self.
 
         Returns:
-            String 'DefaultFilesystemAdapter()' for log output.
+            String 'DefaultFilesystemAdapter()', including the workspace
+            when anchored, for log output.
 
         Raises:
             No exceptions raised.
@@ -461,7 +1120,18 @@ class DefaultFilesystemAdapter:  # pragma: no cover
             >>> print(DefaultFilesystemAdapter())
             DefaultFilesystemAdapter()
         """
-        return "DefaultFilesystemAdapter()"
+        if self._workspace is None:
+            return "DefaultFilesystemAdapter()"
+        return f"DefaultFilesystemAdapter(workspace={self._workspace!r})"
+
+    # Direct stdlib forwarders. Protocol conformance is structural, so binding
+    # the stdlib callables as static attributes skips a Python call frame per
+    # operation; semantics are documented on FilesystemAdapter.
+    exists = staticmethod(os.path.exists)
+    is_symlink = staticmethod(os.path.islink)
+    readlink = staticmethod(Path.readlink)
+    resolve = staticmethod(Path.resolve)
+    remove = staticmethod(os.unlink)
 
     def copy_file(self, src: Path, dst: Path) -> None:
         """Copy file from source to destination with metadata.
@@ -512,8 +1182,9 @@ class DefaultFilesystemAdapter:  # pragma: no cover
     def read_json(self, path: Path) -> JSONValue:
         """Read and parse JSON file to Python data structure.
 
-        Opens file with UTF-8 encoding and parses JSON content.
-        Returns typed JSONValue for downstream processing.
+        Reads raw bytes and lets json detect the UTF encoding, skipping
+        the text-mode codec layer. Returns typed JSONValue for
+        downstream processing.
 
         Args:
             path: Path to JSON file.
@@ -524,18 +1195,20 @@ class DefaultFilesystemAdapter:  # pragma: no cover
         Raises:
             FileNotFoundError: If path does not exist.
             json.JSONDecodeError: If invalid JSON content.
+            ValueError: If path leaves the anchored workspace.
 
         Example:
             >>> data = fs.read_json(Path('package.json'))
         """
-        with open(path, encoding="utf-8") as f:
-            return cast(JSONValue, json.load(f))
+        return cast(JSONValue, json.loads(self._read_bytes(path)))
 
     def write_json(self, path: Path, data: dict[str, Any]) -> None:
         """Write dictionary to file as formatted JSON.
 
         Serializes dict to JSON with 2-space indentation for
-        readability. Creates parent directories if needed.
+        readability. Creates parent directories if needed. Flat dicts
+        of str/int/bool/None values use _fast_encode_shallow; others
+        go through json.dumps. Output is written in one binary write.
 
         Args:
             path: Output file path.
@@ -552,35 +1225,18 @@ class DefaultFilesystemAdapter:  # pragma: no cover
             >>> fs.write_json(Path('out.json'), {'servers': {}})
         """
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-
-    def exists(self, path: Path) -> bool:
-        """Check if file or directory exists.
-
-        Tests path existence for conditional MCP tool operations.
-        Used to check for config files before reading.
-
-        Args:
-            path: Path to check.
-
-        Returns:
-            True if path exists, False otherwise.
-
-        Raises:
-            No exceptions - returns False for inaccessible paths.
-
-        Example:
-            >>> if fs.exists(Path('config.json')): ...
-        """
-        return path.exists()
+        encoded = _fast_encode_shallow(data)
+        if encoded is None:
+            encoded = json.dumps(data, indent=2).encode("ascii")
+        path.write_bytes(encoded)
 
     def glob(self, path: Path, pattern: str) -> list[Path]:
         """Find files matching glob pattern in directory.
 
         Searches directory for files matching shell-style wildcards.
         Essential for batch file discovery in MCP analysis tools that
-        need to process multiple source files.
+        need to process multiple source files. Walks with os.scandir so
+        directory checks reuse cached dirent types instead of stat calls.
 
         Args:
             path: Base directory to search.
@@ -590,141 +1246,161 @@ class DefaultFilesystemAdapter:  # pragma: no cover
             List of matching paths. Empty if no matches.
 
         Raises:
-            PermissionError: If path is not readable.
+            ValueError: If pattern is empty or absolute.
 
         Example:
             >>> files = fs.glob(Path('src'), '**/*.py')
         """
-        return list(path.glob(pattern))
+        return [Path(p) for p in _scandir_glob(os.fspath(path), _split_glob(pattern))]
 
-    def resolve(self, path: Path) -> Path:
-        """Resolve to absolute canonical path.
+    def validate_path(self, path: Path, workspace: Path) -> Path:
+        """Validate path stays within workspace boundaries.
 
-        Converts path to absolute for security validation in MCP tools
-        ensuring user-provided paths stay within workspace.
+        Security check preventing path traversal attacks via
+        ../ or symlinks escaping workspace. Uses the validator's native
+        realpath path since this adapter's symlink ops are the stdlib.
 
         Args:
-            path: Path to resolve.
+            path: User-provided path to validate.
+            workspace: Workspace root boundary.
 
         Returns:
-            Absolute path with symlinks resolved.
+            Validated absolute path.
 
         Raises:
-            No exceptions - returns path even if target missing.
+            ValueError: If path escapes workspace.
 
         Example:
-            >>> abs_path = fs.resolve(Path('./src'))
+            >>> safe = fs.validate_path(Path('src/f.py'), ws)
         """
-        return path.resolve()
+        return PathSecurityValidator.make_validator(workspace)(path)
 
-    def is_symlink(self, path: Path) -> bool:
-        """Check if path is a symbolic link.
+    def read_text(self, path: Path) -> str:
+        """Read file content as UTF-8 string.
+
+        Decodes the raw bytes directly instead of going through a text
+        stream; universal-newline translation is applied only when the
+        content actually contains a carriage return.
 
         Args:
-            path: Path to check.
+            path: Path to text file.
 
         Returns:
-            True if symlink, False otherwise.
+            Complete file content as string.
+
+        Raises:
+            FileNotFoundError: If path does not exist.
+            UnicodeDecodeError: If not valid UTF-8.
+            ValueError: If path leaves the anchored workspace.
 
         Example:
-            >>> fs.is_symlink(Path('link'))
+            >>> code = fs.read_text(Path('main.py'))
         """
-        return path.is_symlink()
+        text = self._read_bytes(path).decode("utf-8")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
 
-    def readlink(self, path: Path) -> Path:
-        """Read symlink target.
+    def write_text(self, path: Path, content: str) -> None:
+        """Write string to file as UTF-8.
+
+        Creates parent directories if needed. Used for generating
+        output files and saving analysis results.
 
         Args:
-            path: Symlink to read.
+            path: Output file path.
+            content: Text to write.
 
         Returns:
-            Target path.
+            None - writes file as side effect.
 
         Raises:
-            OSError: If not a symlink.
+            PermissionError: If path not writable.
 
         Example:
-            >>> fs.readlink(Path('link'))
+            >>> fs.write_text(Path('out.txt'), 'content')
         """
-        return path.readlink()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
 
-    def validate_path(self, path: Path, workspace: Path) -> Path:
-        """Validate path stays within workspace boundaries.
+    def exists_batch(self, paths: list[Path]) -> list[bool]:
+        """Check existence of many paths, overlapping stat syscalls.
 
-        Security check preventing path traversal attacks via
-        ../ or symlinks escaping workspace.
+        Large batches fan out over a thread pool; stat releases the GIL
+        so the lookups overlap. Small batches run serially to avoid
+        pool startup cost.
 
         Args:
-            path: User-provided path to validate.
-            workspace: Workspace root boundary.
+            paths: Paths to check.
 
         Returns:
-            Validated absolute path.
+            Existence flags in input order.
 
         Raises:
-            ValueError: If path escapes workspace.
+            No exceptions - inaccessible paths report False.
 
         Example:
-            >>> safe = fs.validate_path(Path('src/f.py'), ws)
+            >>> fs.exists_batch([Path('a.json'), Path('b.json')])
         """
-        return PathSecurityValidator.validate_workspace_boundary(path, workspace, self)
+        return _map_batch(os.path.exists, paths)
 
-    def remove(self, path: Path) -> None:
-        """Remove file from filesystem.
-
-        Deletes single file for cleanup and replacement workflows.
+    def read_text_batch(self, paths: list[Path]) -> list[str]:
+        """Read many files as UTF-8 strings, concurrently for large batches.
 
         Args:
-            path: File to remove (not directory).
+            paths: Paths to text files.
 
         Returns:
-            None - removes file as side effect.
+            File contents in input order.
 
         Raises:
-            FileNotFoundError: If path does not exist.
-            IsADirectoryError: If path is a directory.
+            FileNotFoundError: If any path does not exist.
+            UnicodeDecodeError: If any file is not valid UTF-8.
 
         Example:
-            >>> fs.remove(Path('temp.txt'))
+            >>> sources = fs.read_text_batch([Path('a.py'), Path('b.py')])
         """
-        os.unlink(path)
+        return _map_batch(self.read_text, paths)
 
-    def read_text(self, path: Path) -> str:
-        """Read file content as UTF-8 string.
+    def read_json_batch(self, paths: list[Path]) -> list[JSONValue]:
+        """Read and parse many JSON files, concurrently for large batches.
 
         Args:
-            path: Path to text file.
+            paths: Paths to JSON files.
 
         Returns:
-            Complete file content as string.
+            Parsed JSON values in input order.
 
         Raises:
-            FileNotFoundError: If path does not exist.
-            UnicodeDecodeError: If not valid UTF-8.
+            FileNotFoundError: If any path does not exist.
+            json.JSONDecodeError: If any file contains invalid JSON.
 
         Example:
-            >>> code = fs.read_text(Path('main.py'))
+            >>> configs = fs.read_json_batch([Path('a.json'), Path('b.json')])
         """
-        return path.read_text(encoding="utf-8")
+        return _map_batch(self.read_json, paths)
 
-    def write_text(self, path: Path, content: str) -> None:
-        """Write string to file as UTF-8.
+    def copy_files(self, pairs: list[tuple[Path, Path]]) -> None:
+        """Copy many files with metadata, concurrently for large batches.
 
-        Creates parent directories if needed. Used for generating
-        output files and saving analysis results.
+        Creates each distinct destination parent once, then runs
+        shutil.copy2 over the pairs; copy2 uses in-kernel copies
+        (sendfile) where available and releases the GIL, so pooled
+        threads overlap real I/O.
 
         Args:
-            path: Output file path.
-            content: Text to write.
+            pairs: (src, dst) tuples; dst parents are created if missing.
 
         Returns:
-            None - writes file as side effect.
+            None - copies files as side effect.
 
         Raises:
-            PermissionError: If path not writable.
+            FileNotFoundError: If any src does not exist.
+            PermissionError: If any src unreadable or dst unwritable.
 
         Example:
-            >>> fs.write_text(Path('out.txt'), 'content')
+            >>> fs.copy_files([(Path('t/a.md'), Path('docs/a.md'))])
         """
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        for parent in {dst.parent for _, dst in pairs}:
+            os.makedirs(parent, exist_ok=True)
+        _map_batch(lambda pair: shutil.copy2(*pair), pairs)
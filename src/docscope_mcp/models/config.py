@@ -4,21 +4,32 @@ Configuration models for DocScope MCP.
 Defines analysis configuration and defaults.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
 from docscope_mcp.models.quality import (
     QUALITY_SCORE_THRESHOLDS,
     QualityThresholds,
+    ScoreCutoffs,
+    build_score_cutoffs,
 )
 
+# Shared read-only default for AnalysisConfig.quality_thresholds
+_DEFAULT_QUALITY_THRESHOLDS: Mapping[str, float] = MappingProxyType(dict(QUALITY_SCORE_THRESHOLDS))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class AnalysisConfig:
     """Configuration for documentation analysis.
 
+    Immutable after construction so instances can be shared freely
+    between the server and analyzers; the score cutoff table is built
+    once in __post_init__. Use dataclasses.replace() to derive variants.
+
     Attributes:
-        quality_thresholds: Score thresholds for quality levels
+        quality_thresholds: Score thresholds for quality levels (read-only)
         thresholds: Detailed quality assessment thresholds
         max_code_size: Maximum code size in bytes (5MB default)
         max_results_display: Maximum results to display
@@ -27,10 +38,11 @@ class AnalysisConfig:
         max_ast_depth: Maximum nesting depth (DoS protection)
         ast_parse_timeout: Seconds before parse timeout
         max_file_path_length: Maximum file path length
+        score_cutoffs: Bisectable table derived from quality_thresholds
     """
 
-    quality_thresholds: dict[str, float] = field(
-        default_factory=lambda: dict(QUALITY_SCORE_THRESHOLDS)
+    quality_thresholds: Mapping[str, float] = field(
+        default_factory=lambda: _DEFAULT_QUALITY_THRESHOLDS
     )
     thresholds: QualityThresholds = field(default_factory=QualityThresholds)
 
@@ -51,13 +63,55 @@ class AnalysisConfig:
     docstring_preview_length: int = 300
     max_missing_elements_display: int = 3
 
+    # Derived state, precomputed once per instance
+    score_cutoffs: ScoreCutoffs = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Freeze threshold mapping and precompute derived state.
+
+        Wraps caller-supplied quality_thresholds in a read-only proxy so
+        the frozen config cannot be mutated through it, checks that the
+        levels are ordered basic <= good <= excellent, then builds the
+        score cutoff table once since no field can change afterwards.
+
+        Args:
+            None - uses instance attributes.
+
+        Returns:
+            None - sets derived state.
+
+        Raises:
+            KeyError: If quality_thresholds lacks a level key.
+            ValueError: If quality_thresholds are not ordered
+                basic <= good <= excellent.
+
+        Example:
+            >>> AnalysisConfig(max_code_size=1024).to_dict()['max_code_size']
+            1024
+        """
+        if not isinstance(self.quality_thresholds, MappingProxyType):
+            thresholds = MappingProxyType(dict(self.quality_thresholds))
+            object.__setattr__(self, "quality_thresholds", thresholds)
+
+        basic, good, excellent = (
+            self.quality_thresholds[k] for k in ("basic", "good", "excellent")
+        )
+        if not basic <= good <= excellent:
+            raise ValueError(
+                "quality_thresholds must satisfy basic <= good <= excellent, "
+                f"got basic={basic}, good={good}, excellent={excellent}"
+            )
+
+        object.__setattr__(self, "score_cutoffs", build_score_cutoffs(self.quality_thresholds))
+
     def to_dict(self) -> dict[str, Any]:
         """Convert configuration to dictionary for serialization.
 
         Exports all configuration values as a plain dict for JSON
         serialization, logging, or compatibility with dict-based APIs.
         Enables configuration inspection, debugging, and round-trip
-        serialization without data loss.
+        serialization without data loss. Each call builds a new dict,
+        so callers may mutate it.
 
         Args:
             None - uses instance attributes.
@@ -76,7 +130,7 @@ class AnalysisConfig:
             True
         """
         return {
-            "quality_thresholds": self.quality_thresholds,
+            "quality_thresholds": dict(self.quality_thresholds),
             "max_code_size": self.max_code_size,
             "max_results_display": self.max_results_display,
             "min_docstring_length": self.min_docstring_length,
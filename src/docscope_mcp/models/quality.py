@@ -5,6 +5,8 @@ Defines quality levels, thresholds, indicators, and assessment results.
 These models are language-agnostic and used across all language analyzers.
 """
 
+from bisect import bisect_right
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
 from typing import Literal, TypedDict
@@ -34,7 +36,7 @@ class QualityLevel(Enum):
     POOR = "poor"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QualityThresholds:
     """Documentation quality assessment thresholds with configurable defaults.
 
@@ -96,6 +98,68 @@ DEFAULT_THRESHOLDS = QualityThresholds()
 # Quality score thresholds mapping categorical levels to numeric ranges
 QUALITY_SCORE_THRESHOLDS = {"excellent": 0.8, "good": 0.6, "basic": 0.3}
 
+# Ascending threshold values paired with the level reached at each index
+type ScoreCutoffs = tuple[tuple[float, ...], tuple[QualityLevel, ...]]
+
+# Levels above POOR, each gated by a threshold in QUALITY_SCORE_THRESHOLDS
+_GRADED_LEVELS = (QualityLevel.BASIC, QualityLevel.GOOD, QualityLevel.EXCELLENT)
+
+
+def build_score_cutoffs(thresholds: Mapping[str, float]) -> ScoreCutoffs:
+    """Precompile a level->threshold mapping into a bisectable table.
+
+    Lays out the basic/good/excellent thresholds in level order once so
+    that classify_score can map a score to its level with one binary
+    search instead of a chain of dict lookups and comparisons. The
+    levels are never reordered, so the table is only valid for
+    thresholds with basic <= good <= excellent (AnalysisConfig enforces
+    this).
+
+    Args:
+        thresholds: Mapping with 'excellent', 'good', and 'basic' keys.
+
+    Returns:
+        Tuple of (ascending threshold values, levels) where levels[i]
+        is the level for scores reaching i thresholds; levels[0] is POOR.
+
+    Raises:
+        KeyError: If a required level key is missing.
+
+    Example:
+        >>> build_score_cutoffs(QUALITY_SCORE_THRESHOLDS)[0]
+        (0.3, 0.6, 0.8)
+    """
+    values = tuple(thresholds[level.value] for level in _GRADED_LEVELS)
+    return values, (QualityLevel.POOR, *_GRADED_LEVELS)
+
+
+def classify_score(score: float, cutoffs: ScoreCutoffs) -> QualityLevel:
+    """Map a numeric quality score to its QualityLevel.
+
+    A score reaching a threshold (>=) earns that level, matching the
+    excellent/good/basic comparison chain it replaces.
+
+    Args:
+        score: Quality score between 0.0 and 1.0.
+        cutoffs: Table from build_score_cutoffs.
+
+    Returns:
+        Highest QualityLevel whose threshold the score reaches.
+
+    Raises:
+        No exceptions raised.
+
+    Example:
+        >>> classify_score(0.6, DEFAULT_SCORE_CUTOFFS)
+        <QualityLevel.GOOD: 'good'>
+    """
+    values, levels = cutoffs
+    return levels[bisect_right(values, score)]
+
+
+# Cutoffs for the default QUALITY_SCORE_THRESHOLDS
+DEFAULT_SCORE_CUTOFFS = build_score_cutoffs(QUALITY_SCORE_THRESHOLDS)
+
 
 class QualityIndicators(TypedDict, total=False):
     """Individual docstring quality criteria.
@@ -157,3 +221,9 @@ class QualityAssessment(TypedDict):
     indicators: QualityIndicators
     missing: list[str]
     needs_improvement: bool
+
+
+# Human-readable labels for missing-indicator reporting, built once at import
+INDICATOR_LABELS: dict[str, str] = {
+    name: name.replace("_", " ") for name in QualityIndicators.__annotations__
+}
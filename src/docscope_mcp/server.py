@@ -11,22 +11,84 @@ Deployment:
     - VS Code MCP extension
     - Claude Desktop
     - Any MCP-compatible client
+
+Environment:
+    DOCSCOPE_ANALYSIS_PROCESSES: Worker processes for analyzer runs
+        (default 0, analyze in-loop). See DocScopeMCPServer.
 """
 
 import asyncio
+import contextlib
+import copy
+import dataclasses
+import hashlib
 import json
 import logging
+import multiprocessing
+import os
 import sys
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from typing import Any
 
 from docscope_mcp.__version__ import __version__
+from docscope_mcp.analyzers import BaseAnalyzer
 from docscope_mcp.analyzers.python import PythonAnalyzer
 from docscope_mcp.models import DEFAULT_CONFIG, AnalysisConfig
 
 # MCP Protocol version
 MCP_VERSION = "2024-11-05"
 
+# Static analyze_functions tool definition; the language enum is filled in
+# per server from its registered analyzers
+_ANALYZE_FUNCTIONS_TOOL: dict[str, Any] = {
+    "name": "analyze_functions",
+    "description": (
+        "Analyze source code functions and identify those needing "
+        "documentation improvement based on quality standards"
+    ),
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "code": {
+                "type": "string",
+                "description": "Source code containing functions to analyze",
+            },
+            "file_path": {
+                "type": "string",
+                "description": "Optional file path for context",
+                "default": "",
+            },
+            "language": {
+                "type": "string",
+                "description": "Programming language (default: python)",
+                "default": "python",
+                "enum": [],
+            },
+        },
+        "required": ["code"],
+    },
+}
+
+# Formatted reports kept for resubmitted code (editors resend on each change)
+_ANALYSIS_CACHE_SIZE = 128
+
+# Report block for one function in _format_results
+_RESULT_TEMPLATE = (
+    "{index}. {name}() [Line {line}]\n"
+    "   Quality: {quality} | Priority: {priority}\n"
+    "   Missing: {missing}\n"
+    "   Current: {current}\n"
+)
+
+# Bytes requested from stdin per read; every complete line received is batched
+_READ_CHUNK_SIZE = 1 << 16
+
+# Environment variable that opts the stdio server into the analysis process pool
+_ANALYSIS_PROCESSES_ENV = "DOCSCOPE_ANALYSIS_PROCESSES"
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
@@ -53,6 +115,93 @@ class JSONRPCErrorCode(Enum):
     INTERNAL_ERROR = -32603
 
 
+def _error_response(message_id: Any, code: JSONRPCErrorCode, message: str) -> dict[str, Any]:
+    """Build a JSON-RPC 2.0 error response.
+
+    Args:
+        message_id: Request ID for response correlation.
+        code: JSON-RPC error code.
+        message: Human-readable error description.
+
+    Returns:
+        JSON-RPC 2.0 error response dict.
+
+    Raises:
+        No exceptions raised.
+
+    Example:
+        >>> _error_response(1, JSONRPCErrorCode.METHOD_NOT_FOUND, 'Unknown method: x')['error']
+        {'code': -32601, 'message': 'Unknown method: x'}
+    """
+    return {"jsonrpc": "2.0", "id": message_id, "error": {"code": code.value, "message": message}}
+
+
+# Dispatch table entry: (message or arguments, message_id) -> response
+type _Handler = Callable[[dict[str, Any], Any], Awaitable[dict[str, Any]]]
+
+# Constant error payloads, shared read-only by every response that needs them
+_MISSING_CODE_ERROR = {
+    "code": JSONRPCErrorCode.INVALID_PARAMS.value,
+    "message": "'code' is required and must be a string",
+}
+_MISSING_CODE_ERROR_JSON = json.dumps(_MISSING_CODE_ERROR)
+_PARSE_ERROR_RESPONSE = _error_response(None, JSONRPCErrorCode.PARSE_ERROR, "Parse error")
+_PARSE_ERROR_JSON = json.dumps(_PARSE_ERROR_RESPONSE)
+
+
+# Per-process state for analysis workers (see DocScopeMCPServer.analysis_processes)
+_worker_config: AnalysisConfig = DEFAULT_CONFIG
+_worker_analyzers: dict[type, BaseAnalyzer] = {}
+
+
+def _init_analysis_worker(config_fields: dict[str, Any]) -> None:
+    """Rebuild the server's AnalysisConfig inside a worker process.
+
+    AnalysisConfig holds a read-only mapping proxy and cannot be pickled,
+    so the pool ships its init fields once per worker instead.
+
+    Args:
+        config_fields: AnalysisConfig init arguments with plain containers.
+
+    Returns:
+        None - sets module-level worker state.
+
+    Raises:
+        TypeError: If config_fields do not match AnalysisConfig.
+
+    Example:
+        >>> _init_analysis_worker({'max_code_size': 1024})
+    """
+    global _worker_config
+    _worker_config = AnalysisConfig(**config_fields)
+    _worker_analyzers.clear()
+
+
+def _analyze_in_worker(
+    analyzer_cls: type, code: str, file_path: str
+) -> list[dict[str, Any]]:  # pragma: no cover
+    """Run one analysis in a worker process, reusing its analyzer.
+
+    Args:
+        analyzer_cls: Analyzer class taking a config keyword argument.
+        code: Source code to analyze.
+        file_path: Optional file path for context.
+
+    Returns:
+        Analyzer results, pickled back to the server process.
+
+    Raises:
+        No exceptions - analyzers report failures in their results.
+
+    Example:
+        >>> _analyze_in_worker(PythonAnalyzer, 'def f(): pass', '')
+    """
+    analyzer = _worker_analyzers.get(analyzer_cls)
+    if analyzer is None:
+        analyzer = _worker_analyzers[analyzer_cls] = analyzer_cls(config=_worker_config)
+    return analyzer.analyze(code, file_path)
+
+
 class DocScopeMCPServer:
     """MCP server for documentation quality analysis.
 
@@ -76,6 +225,7 @@ class DocScopeMCPServer:
         self,
         config: AnalysisConfig | None = None,
         logger_instance: logging.Logger | None = None,
+        analysis_processes: int = 0,
     ) -> None:
         """Initialize MCP server with tool registry and analyzers.
 
@@ -86,6 +236,12 @@ class DocScopeMCPServer:
         Args:
             config: Analysis configuration. Defaults to DEFAULT_CONFIG.
             logger_instance: Logger instance. Defaults to module logger.
+            analysis_processes: Worker processes for analyzer runs. 0 (the
+                default) analyzes on the event loop thread, where the
+                analyzer's SIGALRM parse timeout can be installed; a
+                positive count starts a process pool on first use so
+                analysis runs on other cores. main() reads it from
+                DOCSCOPE_ANALYSIS_PROCESSES.
 
         Returns:
             None - initializes instance attributes.
@@ -99,43 +255,48 @@ class DocScopeMCPServer:
         """
         self.config = config or DEFAULT_CONFIG
         self.logger = logger_instance or logger
+        self.analysis_processes = analysis_processes
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._stdin_pump: asyncio.Task[None] | None = None
+        # Blocking mode of each stdio descriptor before _open_stdio ran
+        self._stdio_blocking: dict[int, bool] = {}
+        # LRU of (language, file_path, code digest) -> formatted report
+        self._analysis_cache: OrderedDict[tuple[str, str, bytes], str] = OrderedDict()
 
         # Initialize analyzers
         self.analyzers = {
             "python": PythonAnalyzer(config=self.config, logger=self.logger),
         }
 
-        # Tool registry
-        self.tools = {
-            "analyze_functions": {
-                "name": "analyze_functions",
-                "description": (
-                    "Analyze source code functions and identify those needing "
-                    "documentation improvement based on quality standards"
-                ),
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "code": {
-                            "type": "string",
-                            "description": "Source code containing functions to analyze",
-                        },
-                        "file_path": {
-                            "type": "string",
-                            "description": "Optional file path for context",
-                            "default": "",
-                        },
-                        "language": {
-                            "type": "string",
-                            "description": "Programming language (default: python)",
-                            "default": "python",
-                            "enum": list(self.analyzers.keys()),
-                        },
-                    },
-                    "required": ["code"],
-                },
+        # Tool registry; only the language enum depends on the instance
+        analyze_tool = copy.deepcopy(_ANALYZE_FUNCTIONS_TOOL)
+        analyze_tool["inputSchema"]["properties"]["language"]["enum"] = list(self.analyzers)
+        self.tools = {"analyze_functions": analyze_tool}
+
+        # initialize and tools/list result bodies never change, so they are
+        # built and JSON-encoded once; responses share them read-only
+        self._initialize_result = {
+            "protocolVersion": MCP_VERSION,
+            "capabilities": {"tools": {}},
+            "serverInfo": {
+                "name": "docscope-mcp-server",
+                "version": __version__,
             },
         }
+        self._tools_list_result = {"tools": list(self.tools.values())}
+        # Method and tool dispatch tables, resolved once per server
+        self._method_handlers: dict[str, _Handler] = {
+            "initialize": self._handle_initialize,
+            "tools/list": self._handle_tools_list,
+            "tools/call": self._handle_tools_call,
+        }
+        self._tool_handlers: dict[str, _Handler] = {
+            "analyze_functions": self._execute_analyze_functions,
+        }
+        self._encoded_results = {
+            id(result): json.dumps(result)
+            for result in (self._initialize_result, self._tools_list_result)
+        }
 
     async def handle_message(self, message: dict[str, Any]) -> dict[str, Any]:
         """Route incoming JSON-RPC 2.0 messages to appropriate handlers.
@@ -166,53 +327,91 @@ class DocScopeMCPServer:
         method = message.get("method")
         message_id = message.get("id")
 
-        if method == "initialize":
-            return {
-                "jsonrpc": "2.0",
-                "id": message_id,
-                "result": {
-                    "protocolVersion": MCP_VERSION,
-                    "capabilities": {"tools": {}},
-                    "serverInfo": {
-                        "name": "docscope-mcp-server",
-                        "version": __version__,
-                    },
-                },
-            }
+        # Non-string methods (e.g. lists) are unhashable; treat as unknown
+        handler = self._method_handlers.get(method) if type(method) is str else None
+        if handler is None:
+            return _error_response(
+                message_id, JSONRPCErrorCode.METHOD_NOT_FOUND, f"Unknown method: {method}"
+            )
+        return await handler(message, message_id)
 
-        elif method == "tools/list":
-            return {
-                "jsonrpc": "2.0",
-                "id": message_id,
-                "result": {"tools": list(self.tools.values())},
-            }
+    async def _handle_initialize(
+        self,
+        message: dict[str, Any],  # noqa: ARG002
+        message_id: Any,
+    ) -> dict[str, Any]:
+        """Answer the MCP initialize handshake.
 
-        elif method == "tools/call":
-            params = message.get("params", {})
-            tool_name = params.get("name")
-            arguments = params.get("arguments", {})
+        Args:
+            message: Incoming JSON-RPC message (unused).
+            message_id: Request ID for response correlation.
 
-            if tool_name == "analyze_functions":
-                return await self._execute_analyze_functions(arguments, message_id)
-            else:
-                return {
-                    "jsonrpc": "2.0",
-                    "id": message_id,
-                    "error": {
-                        "code": JSONRPCErrorCode.METHOD_NOT_FOUND.value,
-                        "message": f"Unknown tool: {tool_name}",
-                    },
-                }
+        Returns:
+            JSON-RPC response with protocol version, capabilities and
+            server info.
 
-        else:
-            return {
-                "jsonrpc": "2.0",
-                "id": message_id,
-                "error": {
-                    "code": JSONRPCErrorCode.METHOD_NOT_FOUND.value,
-                    "message": f"Unknown method: {method}",
-                },
-            }
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> response = await server._handle_initialize({}, 1)
+            >>> response['result']['protocolVersion']
+            '2024-11-05'
+        """
+        return {"jsonrpc": "2.0", "id": message_id, "result": self._initialize_result}
+
+    async def _handle_tools_list(
+        self,
+        message: dict[str, Any],  # noqa: ARG002
+        message_id: Any,
+    ) -> dict[str, Any]:
+        """Advertise the registered tools.
+
+        Args:
+            message: Incoming JSON-RPC message (unused).
+            message_id: Request ID for response correlation.
+
+        Returns:
+            JSON-RPC response listing tool definitions.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> response = await server._handle_tools_list({}, 2)
+            >>> response['result']['tools'][0]['name']
+            'analyze_functions'
+        """
+        return {"jsonrpc": "2.0", "id": message_id, "result": self._tools_list_result}
+
+    async def _handle_tools_call(self, message: dict[str, Any], message_id: Any) -> dict[str, Any]:
+        """Route a tools/call request to the named tool.
+
+        Args:
+            message: Incoming JSON-RPC message with name and arguments params.
+            message_id: Request ID for response correlation.
+
+        Returns:
+            Tool response, or METHOD_NOT_FOUND error for unknown tools.
+
+        Raises:
+            No exceptions - errors returned in JSON-RPC error format.
+
+        Example:
+            >>> response = await server._handle_tools_call(
+            ...     {'params': {'name': 'analyze_functions', 'arguments': {'code': 'x = 1'}}}, 3
+            ... )
+        """
+        params = message.get("params", {})
+        tool_name = params.get("name")
+        arguments = params.get("arguments", {})
+
+        tool = self._tool_handlers.get(tool_name) if type(tool_name) is str else None
+        if tool is None:
+            return _error_response(
+                message_id, JSONRPCErrorCode.METHOD_NOT_FOUND, f"Unknown tool: {tool_name}"
+            )
+        return await tool(arguments, message_id)
 
     async def _execute_analyze_functions(
         self, arguments: dict[str, Any], message_id: Any
@@ -221,6 +420,11 @@ class DocScopeMCPServer:
 
         Validates inputs, runs language analyzer, and formats results.
         Implements the core MCP tool that provides documentation analysis.
+        Reports are cached by language, file path and a digest of the code,
+        so resubmitting unchanged code skips parsing and formatting. The
+        analyzer runs on the calling thread (or in a worker process's main
+        thread), since its parse timeout relies on SIGALRM, which can only
+        be installed from a main thread.
 
         Args:
             arguments: Tool arguments (code, file_path, language).
@@ -245,56 +449,68 @@ class DocScopeMCPServer:
             language = arguments.get("language", "python")
 
             # Validate code parameter
-            if not code or not isinstance(code, str):
-                return {
-                    "jsonrpc": "2.0",
-                    "id": message_id,
-                    "error": {
-                        "code": JSONRPCErrorCode.INVALID_PARAMS.value,
-                        "message": "'code' is required and must be a string",
-                    },
-                }
+            if type(code) is not str or not code:
+                return {"jsonrpc": "2.0", "id": message_id, "error": _MISSING_CODE_ERROR}
+
+            # Validate file_path before it becomes part of the cache key
+            if type(file_path) is not str:
+                return _error_response(
+                    message_id, JSONRPCErrorCode.INVALID_PARAMS, "'file_path' must be a string"
+                )
 
             # Validate code size
             max_size = self.config.max_code_size
             if len(code) > max_size:
-                return {
-                    "jsonrpc": "2.0",
-                    "id": message_id,
-                    "error": {
-                        "code": JSONRPCErrorCode.INVALID_PARAMS.value,
-                        "message": f"Code too large (max {max_size // 1024}KB)",
-                    },
-                }
+                return _error_response(
+                    message_id,
+                    JSONRPCErrorCode.INVALID_PARAMS,
+                    f"Code too large (max {max_size // 1024}KB)",
+                )
 
             # Get analyzer for language
             analyzer = self.analyzers.get(language)
             if not analyzer:
+                return _error_response(
+                    message_id, JSONRPCErrorCode.INVALID_PARAMS, f"Unsupported language: {language}"
+                )
+
+            # Reuse the report for code already analyzed by this server
+            cache_key = (
+                language,
+                file_path,
+                hashlib.blake2b(code.encode(errors="surrogatepass"), digest_size=16).digest(),
+            )
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(cache_key)
                 return {
                     "jsonrpc": "2.0",
                     "id": message_id,
-                    "error": {
-                        "code": JSONRPCErrorCode.INVALID_PARAMS.value,
-                        "message": f"Unsupported language: {language}",
-                    },
+                    "result": {"content": [{"type": "text", "text": cached}]},
                 }
 
-            # Execute analysis
-            results = analyzer.analyze(code, file_path)
+            # Analyze in-loop unless a process pool is configured; a helper
+            # thread would silently lose the SIGALRM parse timeout
+            if self.analysis_processes > 0:
+                results = await asyncio.get_running_loop().run_in_executor(
+                    self._get_process_pool(), _analyze_in_worker, type(analyzer), code, file_path
+                )
+            else:
+                results = analyzer.analyze(code, file_path)
 
             # Handle errors
             if results and "error" in results[0]:
-                return {
-                    "jsonrpc": "2.0",
-                    "id": message_id,
-                    "error": {
-                        "code": JSONRPCErrorCode.INTERNAL_ERROR.value,
-                        "message": f"Analysis failed: {results[0]['error']}",
-                    },
-                }
+                return _error_response(
+                    message_id,
+                    JSONRPCErrorCode.INTERNAL_ERROR,
+                    f"Analysis failed: {results[0]['error']}",
+                )
 
             # Format results
             result_text = self._format_results(results)
+            self._analysis_cache[cache_key] = result_text
+            if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
 
             return {
                 "jsonrpc": "2.0",
@@ -303,15 +519,62 @@ class DocScopeMCPServer:
             }
 
         except Exception as e:
-            self.logger.exception(f"Error in analyze_functions: {e}")
-            return {
-                "jsonrpc": "2.0",
-                "id": message_id,
-                "error": {
-                    "code": JSONRPCErrorCode.INTERNAL_ERROR.value,
-                    "message": f"Internal error: {e!s}",
-                },
+            self.logger.exception("Error in analyze_functions: %s", e)
+            return _error_response(
+                message_id, JSONRPCErrorCode.INTERNAL_ERROR, f"Internal error: {e!s}"
+            )
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the analysis process pool, starting it on first use.
+
+        Workers are spawned rather than forked, since the server already
+        runs threads, and each rebuilds this server's config once.
+
+        Args:
+            None - uses implicit self.
+
+        Returns:
+            Process pool with analysis_processes workers.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> pool = server._get_process_pool()
+        """
+        if self._process_pool is None:
+            config_fields = {
+                f.name: getattr(self.config, f.name)
+                for f in dataclasses.fields(self.config)
+                if f.init
             }
+            config_fields["quality_thresholds"] = dict(self.config.quality_thresholds)
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.analysis_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_analysis_worker,
+                initargs=(config_fields,),
+            )
+        return self._process_pool
+
+    def close(self) -> None:
+        """Shut down the analysis process pool, if one was started.
+
+        Args:
+            None - uses implicit self.
+
+        Returns:
+            None - stops worker processes as side effect.
+
+        Raises:
+            No exceptions raised; safe to call repeatedly.
+
+        Example:
+            >>> server.close()
+        """
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
 
     def _format_results(self, results: list[dict[str, Any]]) -> str:
         """Format analysis results into human-readable report.
@@ -345,46 +608,43 @@ class DocScopeMCPServer:
                 "that meet high quality standards."
             )
 
-        lines = ["Functions needing better docstrings (prioritized):"]
-        lines.append("=" * 60)
-        lines.append("NOTE: Quality assessment analyzes FULL docstrings.")
-        lines.append("")
+        lines = [
+            "Functions needing better docstrings (prioritized):",
+            "=" * 60,
+            "NOTE: Quality assessment analyzes FULL docstrings.",
+            "",
+        ]
 
         max_display = self.config.max_results_display
+        max_missing = self.config.max_missing_elements_display
+        preview_length = self.config.docstring_preview_length
+        render = _RESULT_TEMPLATE.format
         for i, func in enumerate(results[:max_display], 1):
             try:
-                name = func["function_name"]
-                line = func["line_number"]
-                quality = func["quality_assessment"]["quality"]
-                priority = func["priority"]
-                missing = ", ".join(
-                    func["quality_assessment"]["missing"][
-                        : self.config.max_missing_elements_display
-                    ]
-                )
-
-                lines.append(f"{i}. {name}() [Line {line}]")
-                lines.append(f"   Quality: {quality.upper()} | Priority: {priority}")
-                lines.append(f"   Missing: {missing}")
-
-                if func.get("current_docstring"):
-                    preview = (
-                        func["current_docstring"][: self.config.docstring_preview_length]
-                        .replace("\n", " ")
-                        .strip()
-                    )
-                    suffix = (
-                        "..."
-                        if len(func["current_docstring"]) > self.config.docstring_preview_length
-                        else ""
-                    )
-                    lines.append(f"   Current: {preview}{suffix}")
+                docstring = func.get("current_docstring")
+                if docstring:
+                    current = docstring[:preview_length].replace("\n", " ").strip()
+                    if len(docstring) > preview_length:
+                        current += "..."
                 else:
-                    lines.append("   Current: No docstring")
-                lines.append("")
+                    current = "No docstring"
+
+                # One pre-joined block per function; its trailing newline
+                # stands in for the blank separator line
+                lines.append(
+                    render(
+                        index=i,
+                        name=func["function_name"],
+                        line=func["line_number"],
+                        quality=func["quality_assessment"]["quality"].upper(),
+                        priority=func["priority"],
+                        missing=", ".join(func["quality_assessment"]["missing"][:max_missing]),
+                        current=current,
+                    )
+                )
 
             except KeyError as e:
-                self.logger.warning(f"Malformed result at {i}: missing {e}")
+                self.logger.warning("Malformed result at %d: missing %s", i, e)
                 continue
 
         if len(results) > max_display:
@@ -393,6 +653,58 @@ class DocScopeMCPServer:
 
         return "\n".join(lines)
 
+    async def handle_lines(self, lines: Sequence[bytes | bytearray]) -> list[dict[str, Any]]:
+        """Parse and dispatch a batch of JSON-RPC lines read from stdin.
+
+        Lets the stdio loop hand over every message already waiting in
+        the pipe at once, so responses can be written with a single
+        write and drain. Blank lines are skipped; lines that are not
+        valid JSON produce a parse error response in their place, JSON
+        values other than objects an invalid request response, and a
+        message whose handler raises an internal error response, so one
+        bad message never drops the rest of the batch.
+
+        Args:
+            lines: Raw message lines, without trailing newlines.
+
+        Returns:
+            Response dicts in the same order as the non-blank lines.
+
+        Raises:
+            No exceptions - errors returned in JSON-RPC error format.
+
+        Example:
+            >>> responses = await server.handle_lines([b'{"id": 1, "method": "tools/list"}'])
+            >>> 'result' in responses[0]
+            True
+        """
+        responses: list[dict[str, Any]] = []
+        # Per-message loop: resolve module and bound-method lookups once
+        loads, handle, append = json.loads, self.handle_message, responses.append
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                message = loads(line)
+            except ValueError as e:
+                self.logger.error("Invalid JSON: %s", e)
+                append(_PARSE_ERROR_RESPONSE)
+                continue
+            if type(message) is not dict:
+                append(_error_response(None, JSONRPCErrorCode.INVALID_REQUEST, "Invalid Request"))
+                continue
+            try:
+                append(await handle(message))
+            except Exception as e:
+                self.logger.exception("Failed to handle message")
+                append(
+                    _error_response(
+                        message.get("id"), JSONRPCErrorCode.INTERNAL_ERROR, f"Internal error: {e!s}"
+                    )
+                )
+        return responses
+
     async def run(self) -> None:  # pragma: no cover
         """Execute MCP server stdio event loop.
 
@@ -419,38 +731,241 @@ class DocScopeMCPServer:
         """
         self.logger.info("Starting DocScope MCP Server...")
 
-        while True:
-            try:
-                line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+        reader, writer = await self._open_stdio()
+        pending = bytearray()
+        read, handle_lines, write_messages = reader.read, self.handle_lines, self._write_messages
 
-                if not line:
-                    self.logger.info("EOF detected, shutting down")
+        try:
+            while True:
+                try:
+                    # Take whatever the pipe has buffered and handle every
+                    # complete line in it as one batch
+                    chunk = await read(_READ_CHUNK_SIZE)
+
+                    if not chunk:
+                        if pending.strip():
+                            await write_messages(writer, await handle_lines([pending]))
+                        self.logger.info("EOF detected, shutting down")
+                        break
+
+                    pending += chunk
+                    if b"\n" not in chunk:
+                        continue
+
+                    *lines, rest = pending.split(b"\n")
+                    pending = bytearray(rest)
+                    responses = await handle_lines(lines)
+                    if responses:
+                        await write_messages(writer, responses)
+
+                except Exception as e:
+                    self.logger.error("Error processing message: %s", e)
                     break
+        finally:
+            self.close()
+            try:
+                if writer is not None:
+                    # Drain waits until the buffer drops to the low-water
+                    # mark, so a zero limit blocks until every buffered
+                    # response is written
+                    writer.transport.set_write_buffer_limits(high=0)
+                    await writer.drain()
+                    writer.close()
+            finally:
+                self._restore_stdio_blocking()
+
+    async def _open_stdio(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter | None]:  # pragma: no cover
+        """Attach asyncio streams to the process stdin and stdout.
 
-                line = line.strip()
-                if not line:
-                    continue
+        Reading through a StreamReader avoids a thread-pool round trip per
+        message, and a pipe StreamWriter avoids a synchronous print/flush.
+        When stdin cannot be registered with the event loop (e.g. a
+        regular file, or a Windows selector loop), a thread feeds the
+        reader instead; when stdout cannot, writer is None and responses
+        are written to the stdout descriptor with os.write().
 
-                try:
-                    message = json.loads(line)
-                    response = await self.handle_message(message)
-                    print(json.dumps(response), flush=True)
-
-                except json.JSONDecodeError as e:
-                    self.logger.error(f"Invalid JSON: {e}")
-                    error_response = {
-                        "jsonrpc": "2.0",
-                        "id": None,
-                        "error": {
-                            "code": JSONRPCErrorCode.PARSE_ERROR.value,
-                            "message": "Parse error",
-                        },
-                    }
-                    print(json.dumps(error_response), flush=True)
+        Attaching a pipe makes its descriptor non-blocking, and stdin and
+        stdout are shared with the parent process, so their blocking mode
+        is saved first for run() to restore on exit.
 
-            except Exception as e:
-                self.logger.error(f"Error processing message: {e}")
-                break
+        Args:
+            None - uses sys.stdin/sys.stdout.
+
+        Returns:
+            Tuple of (reader, writer or None).
+
+        Raises:
+            No exceptions - unsupported pipes fall back as above.
+
+        Example:
+            >>> reader, writer = await server._open_stdio()
+        """
+        loop = asyncio.get_running_loop()
+        self._save_blocking(sys.stdin)
+        self._save_blocking(sys.stdout)
+        reader = asyncio.StreamReader()
+        try:
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        except (NotImplementedError, ValueError, OSError):
+
+            async def pump() -> None:
+                while chunk := await loop.run_in_executor(None, sys.stdin.buffer.readline):
+                    reader.feed_data(chunk)
+                reader.feed_eof()
+
+            self._stdin_pump = loop.create_task(pump())
+
+        writer: asyncio.StreamWriter | None = None
+        try:
+            transport, protocol = await loop.connect_write_pipe(
+                asyncio.streams.FlowControlMixin, sys.stdout
+            )
+            writer = asyncio.StreamWriter(transport, protocol, None, loop)
+        except (NotImplementedError, ValueError, OSError):
+            pass
+        return reader, writer
+
+    def _save_blocking(self, stream: Any) -> None:
+        """Remember the blocking mode of a stdio stream's descriptor.
+
+        Args:
+            stream: File object such as sys.stdin; objects without a
+                usable descriptor are ignored.
+
+        Returns:
+            None - records the mode in _stdio_blocking.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> server._save_blocking(sys.stdout)
+        """
+        try:
+            fd = stream.fileno()
+            self._stdio_blocking.setdefault(fd, os.get_blocking(fd))
+        except (AttributeError, OSError, ValueError):
+            pass
+
+    def _restore_stdio_blocking(self) -> None:
+        """Put stdio descriptors back into their saved blocking mode.
+
+        Args:
+            None - uses implicit self.
+
+        Returns:
+            None - resets descriptor flags as side effect.
+
+        Raises:
+            No exceptions raised; descriptors already closed are skipped.
+
+        Example:
+            >>> server._restore_stdio_blocking()
+        """
+        for fd, blocking in self._stdio_blocking.items():
+            with contextlib.suppress(OSError):
+                os.set_blocking(fd, blocking)
+        self._stdio_blocking.clear()
+
+    def _encode_response(self, response: dict[str, Any]) -> str:
+        """Serialize a JSON-RPC response, reusing pre-encoded result bodies.
+
+        initialize and tools/list responses carry one of the server's
+        shared result dicts; for those only the id is encoded and spliced
+        into the cached JSON. Shared error payloads are spliced the same
+        way, and the shared parse error response is fully pre-encoded.
+        Output is identical to json.dumps(response).
+
+        Args:
+            response: JSON-RPC response dict from handle_message.
+
+        Returns:
+            JSON text of the response, without trailing newline.
+
+        Raises:
+            TypeError: If response contains non-serializable values.
+
+        Example:
+            >>> server._encode_response({'jsonrpc': '2.0', 'id': 1, 'result': {}})
+            '{"jsonrpc": "2.0", "id": 1, "result": {}}'
+        """
+        if response is _PARSE_ERROR_RESPONSE:
+            return _PARSE_ERROR_JSON
+        if response.get("error") is _MISSING_CODE_ERROR:
+            message_id = json.dumps(response["id"])
+            return f'{{"jsonrpc": "2.0", "id": {message_id}, "error": {_MISSING_CODE_ERROR_JSON}}}'
+        encoded = self._encoded_results.get(id(response.get("result")))
+        if encoded is None:
+            return json.dumps(response)
+        return f'{{"jsonrpc": "2.0", "id": {json.dumps(response["id"])}, "result": {encoded}}}'
+
+    async def _write_messages(
+        self, writer: asyncio.StreamWriter | None, responses: list[dict[str, Any]]
+    ) -> None:  # pragma: no cover
+        """Write a batch of JSON-RPC response lines to stdout.
+
+        Args:
+            writer: Pipe writer from _open_stdio, or None to write to the
+                stdout descriptor directly.
+            responses: JSON-RPC response dicts, in request order.
+
+        Returns:
+            None - writes to stdout as side effect.
+
+        Raises:
+            ConnectionResetError: If the client closed stdout.
+
+        Example:
+            >>> await server._write_messages(writer, [{'jsonrpc': '2.0', 'id': 1}])
+        """
+        payload = "".join([self._encode_response(response) + "\n" for response in responses])
+        data = payload.encode()
+        if writer is not None:
+            writer.write(data)
+            await writer.drain()
+            return
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            # stdout replaced by an object without a descriptor
+            print(payload, end="", flush=True)
+            return
+        # Unbuffered write(2) calls, looping only on partial writes
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+
+
+def _analysis_processes_from_env() -> int:
+    """Read the analysis worker count from DOCSCOPE_ANALYSIS_PROCESSES.
+
+    Args:
+        None - reads os.environ.
+
+    Returns:
+        Non-negative worker count; 0 when unset, blank or invalid.
+
+    Raises:
+        No exceptions - invalid values are logged and ignored.
+
+    Example:
+        >>> os.environ["DOCSCOPE_ANALYSIS_PROCESSES"] = "2"
+        >>> _analysis_processes_from_env()
+        2
+    """
+    raw = os.environ.get(_ANALYSIS_PROCESSES_ENV, "").strip()
+    if not raw:
+        return 0
+    try:
+        processes = int(raw)
+    except ValueError:
+        processes = -1
+    if processes < 0:
+        logger.warning("Ignoring invalid %s=%r", _ANALYSIS_PROCESSES_ENV, raw)
+        return 0
+    return processes
 
 
 async def main() -> None:  # pragma: no cover
@@ -460,7 +975,8 @@ async def main() -> None:  # pragma: no cover
     Called when module is executed directly or via entry point.
 
     Args:
-        None - configures server with defaults.
+        None - configures server with defaults and
+            DOCSCOPE_ANALYSIS_PROCESSES.
 
     Returns:
         None - runs until EOF on stdin.
@@ -472,9 +988,31 @@ async def main() -> None:  # pragma: no cover
         >>> # From command line:
         >>> # python -m docscope_mcp.server
     """
-    server = DocScopeMCPServer()
+    server = DocScopeMCPServer(analysis_processes=_analysis_processes_from_env())
     await server.run()
 
 
-if __name__ == "__main__":  # pragma: no cover
+def serve() -> None:  # pragma: no cover
+    """Synchronous entry point for console scripts and ``python -m``.
+
+    Console-script wrappers call their target without awaiting it, so
+    the docscope-server script points here rather than at main().
+
+    Args:
+        None - configures server with defaults.
+
+    Returns:
+        None - runs until EOF on stdin.
+
+    Raises:
+        No exceptions - errors handled internally.
+
+    Example:
+        >>> # From command line:
+        >>> # docscope-server  or  python -m docscope_mcp
+    """
     asyncio.run(main())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    serve()
@@ -14,13 +14,180 @@ Usage:
 from __future__ import annotations
 
 import fnmatch
+import functools
 import json
+import os
+import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, cast
 
+from docscope_mcp.filesystem import PathSecurityValidator
+
 # Type alias for JSON data structures
 type JSONValue = dict[str, "JSONValue"] | list["JSONValue"] | str | int | float | bool | None
 
+# Characters that make a glob component a pattern rather than a literal name
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
+
+def _invalidates_index(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a bulk dict mutator so it marks the _IndexedFiles index stale.
+
+    Args:
+        method: Unbound dict method to wrap.
+
+    Returns:
+        Function calling method after flagging the index for rebuild.
+
+    Raises:
+        No exceptions raised - errors come from method itself.
+
+    Example:
+        >>> update = _invalidates_index(dict.update)
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: _IndexedFiles, *args: Any, **kwargs: Any) -> Any:
+        self._stale = True
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _literal_root(path: Path, pattern: str) -> Path:
+    """Narrow a glob base by the pattern's leading literal directories.
+
+    Any match of 'pkg/sub/*.py' must start with 'pkg/sub/', so only
+    files indexed under path/pkg/sub can match; looking that directory
+    up rejects everything else without running the regex.
+
+    Args:
+        path: Base path passed to glob.
+        pattern: Glob pattern relative to path.
+
+    Returns:
+        path joined with every directory component before the first
+        one containing a wildcard.
+
+    Raises:
+        No exceptions raised.
+
+    Example:
+        >>> _literal_root(Path('src'), 'pkg/*/mod.py')
+        PosixPath('src/pkg')
+    """
+    literal = []
+    for part in pattern.split("/")[:-1]:
+        if _GLOB_MAGIC.search(part):
+            break
+        literal.append(part)
+    return path.joinpath(*literal)
+
+
+class _IndexedFiles(dict[Path, str]):
+    """Files dict that indexes each file under all of its ancestor directories.
+
+    Behaves exactly like the plain dict tests populate directly, but
+    keeps a directory-to-descendants index so glob only visits files
+    below the searched path. New keys are registered incrementally;
+    removals and bulk updates mark the index stale and it is rebuilt on
+    the next lookup.
+
+    Example:
+        >>> files = _IndexedFiles()
+        >>> files[Path('src/a.py')] = ''
+        >>> files.under(Path('src'))  # [Path('src/a.py')]
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty files dict with an empty index.
+
+        Args:
+            None - no parameters required.
+
+        Returns:
+            None - initializes instance attributes.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> files = _IndexedFiles()
+        """
+        super().__init__()
+        self._index: dict[Path, list[Path]] = {}
+        self._stale = False
+
+    def __setitem__(self, key: Path, value: str) -> None:
+        """Store content, registering new paths under their ancestors.
+
+        Args:
+            key: File path.
+            value: File content.
+
+        Returns:
+            None - modifies dict and index.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> files[Path('a/b.txt')] = 'x'
+        """
+        if not self._stale and key not in self:
+            for parent in key.parents:
+                self._index.setdefault(parent, []).append(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Path) -> None:
+        """Delete a path and mark the index for rebuilding.
+
+        Args:
+            key: File path to delete.
+
+        Returns:
+            None - modifies dict.
+
+        Raises:
+            KeyError: If key is not present.
+
+        Example:
+            >>> del files[Path('a/b.txt')]
+        """
+        super().__delitem__(key)
+        self._stale = True
+
+    pop = _invalidates_index(dict.pop)
+    popitem = _invalidates_index(dict.popitem)
+    clear = _invalidates_index(dict.clear)
+    update = _invalidates_index(dict.update)
+    setdefault = _invalidates_index(dict.setdefault)
+    __ior__ = _invalidates_index(dict.__ior__)
+
+    def under(self, path: Path) -> list[Path]:
+        """Return files below path in insertion order.
+
+        Args:
+            path: Directory to list descendants of.
+
+        Returns:
+            Paths of all files having path as an ancestor.
+
+        Raises:
+            No exceptions raised - returns empty list if none.
+
+        Example:
+            >>> files.under(Path('a'))  # [Path('a/b.txt')]
+        """
+        if self._stale:
+            self._index = {}
+            for key in self:
+                for parent in key.parents:
+                    self._index.setdefault(parent, []).append(key)
+            self._stale = False
+        return self._index.get(path, [])
+
 
 class MockFilesystemAdapter:
     """Mock filesystem adapter for isolated unit testing.
@@ -44,6 +211,8 @@ class MockFilesystemAdapter:
         >>> data = fs.read_json(Path('test.json'))
     """
 
+    __slots__ = ("files", "directories", "symlinks", "symlink_errors", "_workspace")
+
     def __init__(self) -> None:
         """Initialize empty mock filesystem.
 
@@ -63,7 +232,7 @@ class MockFilesystemAdapter:
             >>> fs = MockFilesystemAdapter()
             >>> assert len(fs.files) == 0
         """
-        self.files: dict[Path, str] = {}
+        self.files: dict[Path, str] = _IndexedFiles()
         self.directories: set[Path] = set()
         self.symlinks: dict[Path, Path] = {}
         self.symlink_errors: set[Path] = set()
@@ -109,9 +278,10 @@ class MockFilesystemAdapter:
             >>> fs.files[Path('a.txt')] = 'content'
             >>> fs.copy_file(Path('a.txt'), Path('b.txt'))
         """
-        if src not in self.files:
+        content = self.files.get(src)
+        if content is None:
             raise FileNotFoundError(f"Source not found: {src}")
-        self.files[dst] = self.files[src]
+        self.files[dst] = content
         self.directories.add(dst.parent)
 
     def mkdir(self, path: Path, parents: bool = True, exist_ok: bool = True) -> None:
@@ -139,13 +309,13 @@ class MockFilesystemAdapter:
             raise FileExistsError(f"Directory exists: {path}")
         self.directories.add(path)
         if parents:
-            for parent in path.parents:
-                self.directories.add(parent)
+            self.directories.update(path.parents)
 
     def read_json(self, path: Path) -> JSONValue:
         """Read and parse JSON from mock filesystem.
 
-        Parses JSON string stored in files dict at path.
+        Parses the JSON string stored in files dict at path on every
+        call, like the real adapter re-reading the file.
 
         Args:
             path: Path key in files dict.
@@ -161,9 +331,10 @@ class MockFilesystemAdapter:
             >>> fs.files[Path('a.json')] = '{"k": 1}'
             >>> fs.read_json(Path('a.json'))  # {'k': 1}
         """
-        if path not in self.files:
+        text = self.files.get(path)
+        if text is None:
             raise FileNotFoundError(f"File not found: {path}")
-        return cast(JSONValue, json.loads(self.files[path]))
+        return cast(JSONValue, json.loads(text))
 
     def write_json(self, path: Path, data: dict[str, Any]) -> None:
         """Write JSON string to mock filesystem.
@@ -210,8 +381,9 @@ class MockFilesystemAdapter:
     def glob(self, path: Path, pattern: str) -> list[Path]:
         """Find files matching pattern in mock filesystem.
 
-        Uses fnmatch to filter files dict keys by pattern. Enables
-        testing of batch file operations without real filesystem I/O.
+        Uses fnmatch to filter the files below path, taken from the
+        files directory index, by pattern. Enables testing of batch file
+        operations without real filesystem I/O.
 
         Args:
             path: Base path to search from.
@@ -227,15 +399,16 @@ class MockFilesystemAdapter:
             >>> fs.files[Path('src/a.py')] = ''
             >>> fs.glob(Path('src'), '*.py')  # [Path('src/a.py')]
         """
-        results = []
-        for file_path in self.files:
-            try:
-                relative = file_path.relative_to(path)
-                if fnmatch.fnmatch(str(relative), pattern):
-                    results.append(file_path)
-            except ValueError:
-                continue
-        return results
+        files = cast(_IndexedFiles, self.files)
+        # Indexed files all lie below path, so slicing off its string prefix
+        # gives the relative path without building PurePath objects
+        base = str(path)
+        skip = 0 if base == "." else len(base.rstrip(os.sep)) + 1
+        return [
+            p
+            for p in files.under(_literal_root(path, pattern))
+            if fnmatch.fnmatch(str(p)[skip:], pattern)
+        ]
 
     def resolve(self, path: Path) -> Path:
         """Return path as absolute (mock resolution).
@@ -296,9 +469,10 @@ class MockFilesystemAdapter:
         """
         if path in self.symlink_errors:
             raise OSError(f"Cannot read symlink: {path}")
-        if path not in self.symlinks:
+        target = self.symlinks.get(path)
+        if target is None:
             raise OSError(f"Not a symlink: {path}")
-        return self.symlinks[path]
+        return target
 
     def validate_path(self, path: Path, workspace: Path) -> Path:
         """Validate path stays within workspace using mock symlinks.
@@ -319,8 +493,6 @@ class MockFilesystemAdapter:
         Example:
             >>> fs.validate_path(Path('a'), Path('/workspace'))
         """
-        from docscope_mcp.filesystem import PathSecurityValidator
-
         # Set workspace for resolve operations
         self._workspace = workspace
         return PathSecurityValidator.validate_workspace_boundary(path, workspace, self)
@@ -343,9 +515,10 @@ class MockFilesystemAdapter:
             >>> fs.files[Path('a.txt')] = ''
             >>> fs.remove(Path('a.txt'))
         """
-        if path not in self.files:
-            raise FileNotFoundError(f"File not found: {path}")
-        del self.files[path]
+        try:
+            del self.files[path]
+        except KeyError:
+            raise FileNotFoundError(f"File not found: {path}") from None
 
     def read_text(self, path: Path) -> str:
         """Read text content from mock filesystem.
@@ -363,9 +536,10 @@ class MockFilesystemAdapter:
             >>> fs.files[Path('a.txt')] = 'hello'
             >>> fs.read_text(Path('a.txt'))  # 'hello'
         """
-        if path not in self.files:
+        content = self.files.get(path)
+        if content is None:
             raise FileNotFoundError(f"File not found: {path}")
-        return self.files[path]
+        return content
 
     def write_text(self, path: Path, content: str) -> None:
         """Write text content to mock filesystem.
@@ -387,3 +561,91 @@ class MockFilesystemAdapter:
         """
         self.files[path] = content
         self.directories.add(path.parent)
+
+    def exists_batch(self, paths: list[Path]) -> list[bool]:
+        """Check existence of many paths in mock filesystem.
+
+        Args:
+            paths: Paths to check.
+
+        Returns:
+            Existence flags in input order.
+
+        Example:
+            >>> fs.exists_batch([Path('a.txt'), Path('b.txt')])  # [True, False]
+        """
+        return [self.exists(p) for p in paths]
+
+    def read_text_batch(self, paths: list[Path]) -> list[str]:
+        """Read many text contents from mock filesystem.
+
+        Args:
+            paths: Path keys in files dict.
+
+        Returns:
+            Content strings in input order.
+
+        Raises:
+            FileNotFoundError: If any path not in files dict.
+
+        Example:
+            >>> fs.read_text_batch([Path('a.txt')])  # ['hello']
+        """
+        return [self.read_text(p) for p in paths]
+
+    def read_json_batch(self, paths: list[Path]) -> list[JSONValue]:
+        """Read and parse many JSON contents from mock filesystem.
+
+        Args:
+            paths: Path keys in files dict.
+
+        Returns:
+            Parsed JSON values in input order.
+
+        Raises:
+            FileNotFoundError: If any path not in files dict.
+            json.JSONDecodeError: If any content is invalid JSON.
+
+        Example:
+            >>> fs.read_json_batch([Path('a.json')])  # [{'k': 1}]
+        """
+        return [self.read_json(p) for p in paths]
+
+    def copy_files(self, pairs: list[tuple[Path, Path]]) -> None:
+        """Copy many file contents in mock filesystem.
+
+        Args:
+            pairs: (src, dst) tuples (each src must exist in files dict).
+
+        Returns:
+            None - modifies files dict as side effect.
+
+        Raises:
+            FileNotFoundError: If any src not in files dict.
+
+        Example:
+            >>> fs.copy_files([(Path('a.txt'), Path('b/a.txt'))])
+        """
+        for src, dst in pairs:
+            self.copy_file(src, dst)
+
+    def populate(self, files: dict[Path, str]) -> None:
+        """Write many text files to mock filesystem at once.
+
+        Equivalent to calling write_text for each item, but updates the
+        files dict and directories set in one call each.
+
+        Args:
+            files: Mapping of path to text content.
+
+        Returns:
+            None - modifies files dict and directories set as side effect.
+
+        Raises:
+            No exceptions raised.
+
+        Example:
+            >>> fs.populate({Path('a/x.py'): '', Path('a/y.py'): ''})
+        """
+        self.files.update(files)
+        self.directories.update(path.parent for path in files)
@@ -96,6 +96,20 @@ def process(data):
         private = next(r for r in results if r["function_name"] == "_private_func")
         assert public["priority"] > private["priority"]
 
+    def test_analyze_ast_matches_analyze(self) -> None:
+        """Verify analyze_ast on a parsed tree returns the same results as analyze."""
+        analyzer = PythonAnalyzer()
+        code = "def public_func(x): pass\ndef _private_func(): pass"
+        assert analyzer.analyze_ast(ast.parse(code), "test.py") == analyzer.analyze(code, "test.py")
+
+    def test_analyze_ast_enforces_depth_limit(self) -> None:
+        """Verify analyze_ast still rejects trees deeper than max_ast_depth."""
+        analyzer = PythonAnalyzer(config=AnalysisConfig(max_ast_depth=5))
+        tree = ast.parse("def f():\n    return ((((((1))))))+[[[[[[1]]]]]]")
+        results = analyzer.analyze_ast(tree)
+        assert "error" in results[0]
+        assert "depth" in results[0]["error"].lower()
+
 
 class TestPythonAnalyzerQuality:
     """Tests for quality assessment."""
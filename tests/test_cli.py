@@ -18,6 +18,14 @@ from docscope_mcp.cli import (
 )
 
 
+def _write_workspace_mcp(workspace: Path, content: str) -> Path:
+    """Create workspace .vscode/mcp.json with content and return its path."""
+    mcp_path = workspace / ".vscode" / "mcp.json"
+    mcp_path.parent.mkdir(exist_ok=True)
+    mcp_path.write_text(content)
+    return mcp_path
+
+
 class TestGetVenvPython:
     """Tests for get_venv_python function."""
 
@@ -134,10 +142,7 @@ class TestInstallMcp:
         self, tmp_path: Path, initial_config: dict, expected_servers: list[str]
     ) -> None:
         """Verify install preserves existing servers and handles missing keys."""
-        vscode_dir = tmp_path / ".vscode"
-        vscode_dir.mkdir()
-        mcp_path = vscode_dir / "mcp.json"
-        mcp_path.write_text(json.dumps(initial_config))
+        mcp_path = _write_workspace_mcp(tmp_path, json.dumps(initial_config))
 
         with patch("docscope_mcp.cli.Path.cwd", return_value=tmp_path):
             result = install_mcp(global_install=False)
@@ -149,9 +154,7 @@ class TestInstallMcp:
 
     def test_install_handles_invalid_json(self, tmp_path: Path) -> None:
         """Verify install fails gracefully on invalid JSON."""
-        vscode_dir = tmp_path / ".vscode"
-        vscode_dir.mkdir()
-        (vscode_dir / "mcp.json").write_text("{ invalid json }")
+        _write_workspace_mcp(tmp_path, "{ invalid json }")
 
         with patch("docscope_mcp.cli.Path.cwd", return_value=tmp_path):
             result = install_mcp(global_install=False)
@@ -163,10 +166,9 @@ class TestUninstallMcp:
 
     def test_uninstall_removes_server(self, tmp_path: Path) -> None:
         """Verify uninstall removes docscope-mcp from config."""
-        vscode_dir = tmp_path / ".vscode"
-        vscode_dir.mkdir()
-        mcp_path = vscode_dir / "mcp.json"
-        mcp_path.write_text(json.dumps({"servers": {"docscope-mcp": {}, "other-server": {}}}))
+        mcp_path = _write_workspace_mcp(
+            tmp_path, json.dumps({"servers": {"docscope-mcp": {}, "other-server": {}}})
+        )
 
         with patch("docscope_mcp.cli.Path.cwd", return_value=tmp_path):
             result = uninstall_mcp(global_install=False)
@@ -187,14 +189,10 @@ class TestUninstallMcp:
     )
     def test_uninstall_edge_cases(self, tmp_path: Path, setup: str, expected_code: int) -> None:
         """Verify uninstall handles various edge cases."""
-        vscode_dir = tmp_path / ".vscode"
-
         if setup == "no_server":
-            vscode_dir.mkdir()
-            (vscode_dir / "mcp.json").write_text(json.dumps({"servers": {"other-server": {}}}))
+            _write_workspace_mcp(tmp_path, json.dumps({"servers": {"other-server": {}}}))
         elif setup == "invalid_json":
-            vscode_dir.mkdir()
-            (vscode_dir / "mcp.json").write_text("{ invalid json }")
+            _write_workspace_mcp(tmp_path, "{ invalid json }")
         # "no_config" - do nothing, dir doesn't exist
 
         with patch("docscope_mcp.cli.Path.cwd", return_value=tmp_path):
@@ -232,11 +230,8 @@ class TestMain:
         home_dir = tmp_path / "home"
         home_dir.mkdir()
 
-        with (
-            patch.object(sys, "argv", ["docscope-mcp", "install", "--global"]),
-            patch("docscope_mcp.cli.Path.home", return_value=home_dir),
-        ):
-            result = main()
+        with patch("docscope_mcp.cli.Path.home", return_value=home_dir):
+            result = main(["install", "--global"])
             assert result == 0
             global_path = home_dir / ".config" / "Code" / "User" / "mcp.json"
             assert global_path.exists()
@@ -264,11 +259,8 @@ class TestMain:
             mcp_json = insiders_path / "mcp.json"
             mcp_json.write_text(json.dumps({"servers": {"docscope-mcp": {}}}))
 
-        with (
-            patch.object(sys, "argv", ["docscope-mcp", command, *flags]),
-            patch("docscope_mcp.cli.Path.home", return_value=home_dir),
-        ):
-            result = main()
+        with patch("docscope_mcp.cli.Path.home", return_value=home_dir):
+            result = main([command, *flags])
             assert result == 0
             assert expected_path_part in str(insiders_path)
 
@@ -289,6 +281,4 @@ class TestMain:
     )
     def test_insiders_requires_global(self, command: str, flags: list[str]) -> None:
         """Verify --insiders without --global returns error."""
-        with patch.object(sys, "argv", ["docscope-mcp", command, *flags]):
-            result = main()
-            assert result == 1
+        assert main([command, *flags]) == 1
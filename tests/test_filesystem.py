@@ -1,12 +1,17 @@
 """Tests for filesystem abstraction."""
 
+import json
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from docscope_mcp.filesystem import (
+    _ANCHORED_OPEN,
     DefaultFilesystemAdapter,
     PathSecurityValidator,
+    _fast_encode_shallow,
+    _read_file_bytes,
 )
 from tests.mock_filesystem import MockFilesystemAdapter
 
@@ -28,6 +33,36 @@ class TestMockFilesystemAdapter:
         result = mock.read_json(Path("test.json"))
         assert result == data
 
+    @pytest.mark.parametrize(
+        "data",
+        [{"a": 1, "b": "\u00e9", "c": None}, {"nested": {"inner": [1]}}],
+        ids=["flat", "nested"],
+    )
+    def test_mock_write_json_text_matches_real_format(self, data: dict[str, Any]) -> None:
+        """Verify stored JSON text is the same indented form the real adapter writes."""
+        mock = MockFilesystemAdapter()
+        mock.write_json(Path("test.json"), data)
+        assert mock.files[Path("test.json")] == json.dumps(data, indent=2)
+
+    def test_mock_read_json_tracks_text_overwrite(self) -> None:
+        """Verify read_json honours direct text edits."""
+        mock = MockFilesystemAdapter()
+        mock.write_json(Path("test.json"), {"key": "value"})
+        mock.files[Path("test.json")] = '{"key": "edited"}'
+        assert mock.read_json(Path("test.json")) == {"key": "edited"}
+
+    def test_mock_read_json_does_not_alias_written_data(self) -> None:
+        """Verify mutating written or read dicts does not change later reads."""
+        mock = MockFilesystemAdapter()
+        data = {"key": "value", "nested": {"n": 1}}
+        mock.write_json(Path("test.json"), data)
+        data["key"] = "changed"
+        data["nested"]["n"] = 2  # type: ignore[index]
+        first = mock.read_json(Path("test.json"))
+        assert first == {"key": "value", "nested": {"n": 1}}
+        first["key"] = "mutated"  # type: ignore[index]
+        assert mock.read_json(Path("test.json")) == {"key": "value", "nested": {"n": 1}}
+
     def test_mock_write_read_text(self) -> None:
         """Verify text write/read roundtrip preserves content."""
         mock = MockFilesystemAdapter()
@@ -93,6 +128,59 @@ class TestMockFilesystemAdapter:
         results = mock.glob(Path("dir"), "*.txt")
         assert len(results) == 2
 
+    @pytest.mark.parametrize("base", [".", "/", "/workspace", "dir"], ids=str)
+    def test_mock_glob_relative_matching(self, base: str) -> None:
+        """Verify mock glob matches patterns against paths relative to base."""
+        mock = MockFilesystemAdapter()
+        root = Path(base)
+        for rel in ["a.py", "pkg/b.py", "pkg/c.txt", "pkg/sub/d.py"]:
+            mock.files[root / rel] = ""
+        assert mock.glob(root, "pkg/*.py") == [root / "pkg" / "b.py", root / "pkg/sub/d.py"]
+        assert mock.glob(root, "pkg/sub/d.py") == [root / "pkg/sub/d.py"]
+        assert mock.glob(root, "p*/sub/*.py") == [root / "pkg/sub/d.py"]
+        assert mock.glob(root, "nope/*.py") == []
+        assert mock.glob(root, "*.py") == [
+            root / "a.py",
+            root / "pkg" / "b.py",
+            root / "pkg/sub/d.py",
+        ]
+
+    def test_mock_glob_index_follows_mutations(self) -> None:
+        """Verify glob sees direct files edits, removals and other dirs."""
+        mock = MockFilesystemAdapter()
+        mock.write_text(Path("dir/a.txt"), "a")
+        mock.files[Path("dir/sub/b.txt")] = "b"
+        mock.write_text(Path("other/c.txt"), "c")
+        assert mock.glob(Path("dir"), "*.txt") == [Path("dir/a.txt"), Path("dir/sub/b.txt")]
+        mock.remove(Path("dir/a.txt"))
+        mock.files.update({Path("dir/d.txt"): "d"})
+        assert mock.glob(Path("dir"), "*.txt") == [Path("dir/sub/b.txt"), Path("dir/d.txt")]
+
+    def test_mock_batch_reads(self) -> None:
+        """Verify batch methods return per-path results in input order."""
+        mock = MockFilesystemAdapter()
+        mock.write_text(Path("a.txt"), "a")
+        mock.write_json(Path("b.json"), {"k": 1})
+        assert mock.exists_batch([Path("a.txt"), Path("nope"), Path("b.json")]) == [
+            True,
+            False,
+            True,
+        ]
+        assert mock.read_text_batch([Path("a.txt")]) == ["a"]
+        assert mock.read_json_batch([Path("b.json")]) == [{"k": 1}]
+
+    def test_mock_populate_matches_write_text(self) -> None:
+        """Verify populate leaves the same state as repeated write_text."""
+        seed = {Path("a/x.py"): "x", Path("a/b/y.py"): "y", Path("z.txt"): "z"}
+        bulk = MockFilesystemAdapter()
+        bulk.populate(seed)
+        single = MockFilesystemAdapter()
+        for path, content in seed.items():
+            single.write_text(path, content)
+        assert bulk.files == single.files
+        assert bulk.directories == single.directories
+        assert bulk.glob(Path("a"), "*.py") == [Path("a/x.py"), Path("a/b/y.py")]
+
     def test_mock_repr(self) -> None:
         """Verify __repr__ shows class name and state counts."""
         mock = MockFilesystemAdapter()
@@ -110,6 +198,177 @@ class TestDefaultFilesystemAdapter:
         fs = DefaultFilesystemAdapter()
         assert repr(fs) == "DefaultFilesystemAdapter()"
 
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "*.py",
+            "**/*.py",
+            "**",
+            "pkg/**",
+            "pkg/*/deep.py",
+            "**/sub",
+            "pkg/../docs/*.md",
+            "*/",
+            "**/",
+            "pkg/sub/",
+        ],
+        ids=[
+            "flat",
+            "recursive",
+            "bare_recursive",
+            "trailing_recursive",
+            "nested",
+            "dir",
+            "dotdot",
+            "dirs_only",
+            "recursive_dirs_only",
+            "literal_dir_only",
+        ],
+    )
+    def test_glob_matches_pathlib(self, tmp_path: Path, pattern: str) -> None:
+        """Verify scandir-based glob returns the same paths as Path.glob."""
+        for rel in ["top.py", ".hidden.py", "pkg/mod.py", "pkg/sub/deep.py", "docs/a.md"]:
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).touch()
+
+        result = DefaultFilesystemAdapter().glob(tmp_path, pattern)
+        assert sorted(result) == sorted(tmp_path.glob(pattern))
+
+    @pytest.mark.parametrize("count", [3, 40], ids=["serial", "threaded"])
+    def test_batch_methods_preserve_order(self, tmp_path: Path, count: int) -> None:
+        """Verify batch reads match per-path results for serial and pooled batches."""
+        fs = DefaultFilesystemAdapter()
+        paths = [tmp_path / f"f{i}.json" for i in range(count)]
+        for i, path in enumerate(paths):
+            fs.write_json(path, {"index": i})
+
+        assert fs.exists_batch([*paths, tmp_path / "missing"]) == [True] * count + [False]
+        assert fs.read_json_batch(paths) == [{"index": i} for i in range(count)]
+        assert fs.read_text_batch(paths) == [p.read_text() for p in paths]
+
+    @pytest.mark.parametrize("count", [3, 40], ids=["serial", "threaded"])
+    def test_copy_files(self, tmp_path: Path, count: int) -> None:
+        """Verify copy_files creates parents and copies every pair."""
+        fs = DefaultFilesystemAdapter()
+        pairs = []
+        for i in range(count):
+            src = tmp_path / "src" / f"f{i}.md"
+            src.parent.mkdir(exist_ok=True)
+            src.write_text(f"doc {i}")
+            pairs.append((src, tmp_path / "out" / f"d{i % 3}" / src.name))
+
+        fs.copy_files(pairs)
+        assert [dst.read_text() for _, dst in pairs] == [f"doc {i}" for i in range(count)]
+
+    @pytest.mark.parametrize(
+        "raw",
+        [b"plain\n", b"crlf\r\nline\r\n", b"cr\rmixed\r\n\n", "caf\u00e9\n".encode(), b""],
+        ids=["lf", "crlf", "mixed", "utf8", "empty"],
+    )
+    def test_read_text_matches_pathlib(self, tmp_path: Path, raw: bytes) -> None:
+        """Verify bytes-decoding read_text matches Path.read_text newline handling."""
+        path = tmp_path / "f.txt"
+        path.write_bytes(raw)
+        assert DefaultFilesystemAdapter().read_text(path) == path.read_text(encoding="utf-8")
+
+    @pytest.mark.parametrize("size", [0, 1, 100_000], ids=["empty", "one", "large"])
+    def test_read_file_bytes_sizes(self, tmp_path: Path, size: int) -> None:
+        """Verify fstat-sized reads return the whole file at any size."""
+        path = tmp_path / "blob"
+        path.write_bytes(bytes(range(256)) * (size // 256) + b"x" * (size % 256))
+        assert _read_file_bytes(path) == path.read_bytes()
+
+    def test_read_file_bytes_missing(self, tmp_path: Path) -> None:
+        """Verify a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            _read_file_bytes(tmp_path / "missing")
+
+    @pytest.mark.skipif(not _ANCHORED_OPEN, reason="requires dir_fd support")
+    def test_anchored_reads_stay_in_workspace(self, tmp_path: Path) -> None:
+        """Verify workspace-anchored reads refuse escapes and symlinks."""
+        ws = tmp_path / "ws"
+        (ws / "src").mkdir(parents=True)
+        (ws / "src" / "a.json").write_text('{"k": 1}')
+        (tmp_path / "secret.txt").write_text("secret")
+        (ws / "link.txt").symlink_to(tmp_path / "secret.txt")
+        (ws / "linkdir").symlink_to(ws / "src")
+
+        fs = DefaultFilesystemAdapter(ws)
+        try:
+            assert repr(fs) == f"DefaultFilesystemAdapter(workspace={ws!r})"
+            assert fs.read_json(ws / "src" / "a.json") == {"k": 1}
+            for bad in [tmp_path / "secret.txt", ws / "src" / ".." / ".." / "secret.txt"]:
+                with pytest.raises(ValueError, match="escapes workspace"):
+                    fs.read_text(bad)
+            with pytest.raises(ValueError, match="Symlink target escapes workspace"):
+                fs.read_text(ws / "link.txt")
+            assert fs.read_json(ws / "linkdir" / "a.json") == {"k": 1}
+            assert fs.read_json(Path("linkdir/../src/a.json")) == {"k": 1}
+            with pytest.raises(FileNotFoundError):
+                fs.read_text(ws / "src" / "missing.py")
+        finally:
+            fs.close()
+
+    @pytest.mark.skipif(not _ANCHORED_OPEN, reason="requires dir_fd support")
+    def test_anchored_close_is_idempotent(self, tmp_path: Path) -> None:
+        """Verify close releases the workspace descriptor and may be repeated."""
+        fs = DefaultFilesystemAdapter(tmp_path)
+        fs.close()
+        fs.close()
+        assert fs._workspace_fd is None
+
+    @pytest.mark.skipif(not _ANCHORED_OPEN, reason="requires dir_fd support")
+    def test_anchored_reads_accept_validated_paths(self, tmp_path: Path) -> None:
+        """Verify validate_path output reads back through a symlinked workspace."""
+        real = tmp_path / "real"
+        (real / "sub").mkdir(parents=True)
+        (real / "sub" / "f.py").write_text("x = 1\n")
+        (real / "alias").symlink_to("sub")
+        (real / "abs_alias").symlink_to(real / "sub")
+        ws = tmp_path / "wslink"
+        ws.symlink_to(real)
+
+        fs = DefaultFilesystemAdapter(ws)
+        try:
+            for rel in ["sub/f.py", "alias/f.py", "abs_alias/f.py"]:
+                assert fs.read_text(fs.validate_path(Path(rel), ws)) == "x = 1\n"
+                assert fs.read_text(ws / rel) == "x = 1\n"
+                assert fs.read_text(Path(rel)) == "x = 1\n"
+        finally:
+            fs.close()
+
+    @pytest.mark.parametrize("pattern", ["", "/abs/*.py"], ids=["empty", "absolute"])
+    def test_glob_rejects_bad_patterns(self, tmp_path: Path, pattern: str) -> None:
+        """Verify empty and absolute glob patterns raise ValueError."""
+        with pytest.raises(ValueError, match="Unacceptable pattern"):
+            DefaultFilesystemAdapter().glob(tmp_path, pattern)
+
+
+class TestFastEncodeShallow:
+    """Tests for the shallow write_json encoder."""
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {},
+            {"name": "docscope", "count": 3, "enabled": True, "missing": None},
+            {'quote"key': "line\nbreak", "unicode": "caf\u00e9", "neg": -7, "off": False},
+        ],
+        ids=["empty", "mixed_scalars", "escaping"],
+    )
+    def test_matches_stdlib_output(self, data: dict) -> None:
+        """Verify fast encoder output is byte-identical to json.dumps."""
+        assert _fast_encode_shallow(data) == json.dumps(data, indent=2).encode("ascii")
+
+    @pytest.mark.parametrize(
+        "data",
+        [{"nested": {}}, {"items": [1]}, {"ratio": 0.5}, {1: "int_key"}],
+        ids=["nested_dict", "list_value", "float_value", "non_str_key"],
+    )
+    def test_unsupported_shapes_fall_back(self, data: dict) -> None:
+        """Verify non-flat or non-scalar data returns None for stdlib fallback."""
+        assert _fast_encode_shallow(data) is None
+
 
 class TestPathSecurityValidator:
     """Tests for PathSecurityValidator."""
@@ -129,6 +388,28 @@ class TestPathSecurityValidator:
                 Path("../../../etc/passwd"), workspace
             )
 
+    def test_make_validator_is_memoized(self, tmp_path: Path) -> None:
+        """Verify per-workspace validators are reused and enforce the boundary."""
+        validate = PathSecurityValidator.make_validator(tmp_path)
+        assert PathSecurityValidator.make_validator(tmp_path) is validate
+        assert validate(Path("a/b.py")) == tmp_path.resolve() / "a" / "b.py"
+        with pytest.raises(ValueError, match="Path escapes workspace"):
+            validate(Path("../x"))
+
+    @pytest.mark.parametrize("use_adapter", [False, True], ids=["native", "adapter"])
+    def test_relative_workspace_follows_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_adapter: bool
+    ) -> None:
+        """Verify a relative workspace is re-resolved after the cwd changes."""
+        (tmp_path / "wsA").mkdir()
+        (tmp_path / "wsB").mkdir()
+        fs = DefaultFilesystemAdapter() if use_adapter else None
+        validate = PathSecurityValidator.validate_workspace_boundary
+        monkeypatch.chdir(tmp_path / "wsA")
+        assert validate(Path("f.py"), Path("."), fs) == (tmp_path / "wsA" / "f.py").resolve()
+        monkeypatch.chdir(tmp_path / "wsB")
+        assert validate(Path("f.py"), Path("."), fs) == (tmp_path / "wsB" / "f.py").resolve()
+
     @pytest.mark.parametrize(
         ("symlink_target", "is_absolute", "should_raise", "error_match"),
         [
@@ -157,6 +438,30 @@ class TestPathSecurityValidator:
             result = mock.validate_path(Path("link/file.txt"), workspace)
             assert result == workspace / "link" / "file.txt"
 
+    @pytest.mark.parametrize(
+        ("target_inside", "should_raise"),
+        [(True, False), (False, True)],
+        ids=["native_symlink_inside", "native_symlink_escapes"],
+    )
+    def test_symlink_validation_native(
+        self, tmp_path: Path, target_inside: bool, should_raise: bool
+    ) -> None:
+        """Verify native realpath validation detects escaping symlinks."""
+        workspace = tmp_path / "workspace"
+        outside = tmp_path / "outside"
+        (workspace / "real").mkdir(parents=True)
+        outside.mkdir()
+        (workspace / "link").symlink_to(workspace / "real" if target_inside else outside)
+
+        if should_raise:
+            with pytest.raises(ValueError, match="Symlink target escapes"):
+                PathSecurityValidator.validate_workspace_boundary(Path("link/f.txt"), workspace)
+        else:
+            result = PathSecurityValidator.validate_workspace_boundary(
+                Path("link/f.txt"), workspace
+            )
+            assert result == workspace.resolve() / "real" / "f.txt"
+
     def test_symlink_oserror_via_adapter(self) -> None:
         """Verify OSError reading symlink raises ValueError."""
         mock = MockFilesystemAdapter()
@@ -8,12 +8,23 @@ from docscope_mcp.models import (
     QualityLevel,
     QualityThresholds,
 )
+from docscope_mcp.models.quality import DEFAULT_SCORE_CUTOFFS, classify_score
 
 
 class TestQualityLevel:
     """Tests for QualityLevel enum."""
 
-    def test_quality_levels_exist(self) -> None:
+    @pytest.mark.parametrize(
+        ("level", "expected"),
+        [
+            (QualityLevel.EXCELLENT, "excellent"),
+            (QualityLevel.GOOD, "good"),
+            (QualityLevel.BASIC, "basic"),
+            (QualityLevel.POOR, "poor"),
+        ],
+        ids=["excellent", "good", "basic", "poor"],
+    )
+    def test_quality_levels_exist(self, level: QualityLevel, expected: str) -> None:
         """Verifies all four quality levels are defined with correct values.
 
         Tests enum completeness.
@@ -28,12 +39,49 @@ class TestQualityLevel:
         Access each enum value.
 
         Assertion Strategy:
-        Validates all four levels have expected string values.
+        Validates each level has its expected string value.
         """
-        assert QualityLevel.EXCELLENT.value == "excellent"
-        assert QualityLevel.GOOD.value == "good"
-        assert QualityLevel.BASIC.value == "basic"
-        assert QualityLevel.POOR.value == "poor"
+        assert level.value == expected
+
+    @pytest.mark.parametrize(
+        ("score", "expected"),
+        [
+            (0.0, QualityLevel.POOR),
+            (0.29, QualityLevel.POOR),
+            (0.3, QualityLevel.BASIC),
+            (0.6, QualityLevel.GOOD),
+            (0.79, QualityLevel.GOOD),
+            (0.8, QualityLevel.EXCELLENT),
+            (1.0, QualityLevel.EXCELLENT),
+        ],
+        ids=[
+            "zero",
+            "below_basic",
+            "at_basic",
+            "at_good",
+            "below_excellent",
+            "at_excellent",
+            "max",
+        ],
+    )
+    def test_classify_score_boundaries(self, score: float, expected: QualityLevel) -> None:
+        """Verifies scores at or above a threshold earn that level.
+
+        Tests classify_score against the default cutoff table.
+
+        Business context:
+        Level boundaries decide which functions are reported for improvement.
+
+        Arrangement:
+        1. Use DEFAULT_SCORE_CUTOFFS built from QUALITY_SCORE_THRESHOLDS.
+
+        Action:
+        Classify scores on and around each threshold.
+
+        Assertion Strategy:
+        Validates >= semantics at every boundary.
+        """
+        assert classify_score(score, DEFAULT_SCORE_CUTOFFS) is expected
 
     def test_quality_level_count(self) -> None:
         """Verifies exactly four quality levels exist.
@@ -58,7 +106,17 @@ class TestQualityLevel:
 class TestQualityThresholds:
     """Tests for QualityThresholds dataclass."""
 
-    def test_default_thresholds(self) -> None:
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("max_brief_lines", 1),
+            ("min_brief_chars", 100),
+            ("complexity_high", 10),
+            ("complexity_medium", 5),
+        ],
+        ids=["max_brief_lines", "min_brief_chars", "complexity_high", "complexity_medium"],
+    )
+    def test_default_thresholds(self, attr: str, expected: int) -> None:
         """Verifies QualityThresholds has sensible default values.
 
         Tests default configuration.
@@ -75,11 +133,7 @@ class TestQualityThresholds:
         Assertion Strategy:
         Validates max_brief_lines=1, min_brief_chars=100, complexity defaults.
         """
-        thresholds = QualityThresholds()
-        assert thresholds.max_brief_lines == 1
-        assert thresholds.min_brief_chars == 100
-        assert thresholds.complexity_high == 10
-        assert thresholds.complexity_medium == 5
+        assert getattr(QualityThresholds(), attr) == expected
 
     def test_thresholds_immutable(self) -> None:
         """Verifies QualityThresholds is frozen (immutable).
@@ -102,6 +156,28 @@ class TestQualityThresholds:
         with pytest.raises(AttributeError):
             thresholds.max_brief_lines = 5  # type: ignore[misc]
 
+    def test_thresholds_slotted(self) -> None:
+        """Verifies QualityThresholds stores fields in slots.
+
+        Tests dataclass slots=True.
+
+        Business context:
+        Every AnalysisConfig carries a thresholds instance; slots keep
+        it free of a per-instance __dict__.
+
+        Arrangement:
+        1. Create QualityThresholds instance.
+
+        Action:
+        Inspect instance attributes.
+
+        Assertion Strategy:
+        Validates no __dict__ exists and fields remain readable.
+        """
+        thresholds = QualityThresholds()
+        assert not hasattr(thresholds, "__dict__")
+        assert thresholds.min_bullet_points == 3
+
     def test_custom_thresholds(self) -> None:
         """Verifies custom threshold values override defaults.
 
@@ -220,3 +296,91 @@ class TestAnalysisConfig:
         )
         assert config.max_code_size == 1024
         assert config.max_results_display == 5
+
+    def test_config_immutable(self) -> None:
+        """Verifies AnalysisConfig is frozen, including its threshold mapping.
+
+        Tests dataclass frozen=True and read-only quality_thresholds.
+
+        Business context:
+        DEFAULT_CONFIG is shared by the server and every analyzer instance.
+
+        Arrangement:
+        1. Create AnalysisConfig with a caller-owned thresholds dict.
+
+        Action:
+        Attempt to modify an attribute and a threshold entry.
+
+        Assertion Strategy:
+        Validates both raise and the caller's dict is not aliased.
+        """
+        custom = {"excellent": 0.9, "good": 0.7, "basic": 0.4}
+        config = AnalysisConfig(quality_thresholds=custom)
+        with pytest.raises(AttributeError):
+            config.max_code_size = 1  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            config.quality_thresholds["excellent"] = 0.1  # type: ignore[index]
+        custom["excellent"] = 0.1
+        assert config.quality_thresholds["excellent"] == 0.9
+
+    @pytest.mark.parametrize(
+        "thresholds",
+        [
+            {"excellent": 0.6, "good": 0.8, "basic": 0.3},
+            {"excellent": 0.8, "good": 0.2, "basic": 0.3},
+        ],
+        ids=["good_above_excellent", "basic_above_good"],
+    )
+    def test_config_rejects_unordered_thresholds(self, thresholds: dict[str, float]) -> None:
+        """Verifies AnalysisConfig rejects quality thresholds out of level order.
+
+        Tests basic <= good <= excellent validation.
+
+        Business context:
+        Scores are classified by bisecting the thresholds in level order;
+        unordered thresholds would silently grade scores differently.
+
+        Arrangement:
+        1. Build threshold dicts with one pair of levels swapped.
+
+        Action:
+        Construct AnalysisConfig with each dict.
+
+        Assertion Strategy:
+        Validates ValueError names the required ordering.
+        """
+        with pytest.raises(ValueError, match="basic <= good <= excellent"):
+            AnalysisConfig(quality_thresholds=thresholds)
+
+    def test_config_to_dict_independent(self) -> None:
+        """Verifies to_dict returns an independent JSON-serializable copy.
+
+        Tests serialization without shared or private state.
+
+        Business context:
+        DEFAULT_CONFIG is shared, so one caller's edits to its dict must not
+        leak into another's, and dataclass introspection must see only
+        real config fields.
+
+        Arrangement:
+        1. Create default AnalysisConfig.
+
+        Action:
+        Call to_dict, mutate the result, call again and JSON-encode.
+
+        Assertion Strategy:
+        Validates equal but distinct dicts, unaffected later calls and
+        no private fields in dataclasses.fields().
+        """
+        import dataclasses
+        import json
+
+        config = AnalysisConfig()
+        first = config.to_dict()
+        assert first == config.to_dict()
+        assert first is not config.to_dict()
+        first["max_code_size"] = 0
+        first["quality_thresholds"]["good"] = 0.0
+        assert config.to_dict()["max_code_size"] == AnalysisConfig().max_code_size
+        assert json.loads(json.dumps(config.to_dict()))["quality_thresholds"]["good"] == 0.6
+        assert not [f.name for f in dataclasses.fields(config) if f.name.startswith("_")]
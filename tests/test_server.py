@@ -1,5 +1,11 @@
 """Tests for MCP server."""
 
+import json
+import signal
+import time
+from typing import Any
+from unittest.mock import patch
+
 import pytest
 
 from docscope_mcp.server import DocScopeMCPServer, JSONRPCErrorCode
@@ -41,6 +47,48 @@ class TestDocScopeMCPServer:
         tool_names = [t["name"] for t in response["result"]["tools"]]
         assert "analyze_functions" in tool_names
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("method", "params"),
+        [
+            ("initialize", {}),
+            ("tools/list", {}),
+            ("unknown", {}),
+            ("tools/call", {"name": "analyze_functions", "arguments": {}}),
+        ],
+        ids=["initialize", "tools_list", "unknown", "missing_code"],
+    )
+    @pytest.mark.parametrize("message_id", [7, "req-\u00e9", None])
+    async def test_encode_response_matches_json_dumps(
+        self, method: str, params: dict[str, Any], message_id: int | str | None
+    ) -> None:
+        """Verify pre-encoded responses serialize exactly like json.dumps."""
+        server = DocScopeMCPServer()
+        response = await server.handle_message(
+            {"jsonrpc": "2.0", "id": message_id, "method": method, "params": params}
+        )
+        assert server._encode_response(response) == json.dumps(response)
+
+    @pytest.mark.asyncio
+    async def test_handle_lines_batch(self) -> None:
+        """Verify batched lines answer in order, isolating bad and failing messages."""
+        server = DocScopeMCPServer()
+        lines = [
+            b'{"jsonrpc": "2.0", "id": 1, "method": "initialize"}',
+            b"  ",
+            bytearray(b"not json"),
+            b"[1, 2]",
+            b'{"jsonrpc": "2.0", "id": 3, "method": "tools/call", "params": []}',
+            b'{"jsonrpc": "2.0", "id": 2, "method": "tools/list"}\r',
+        ]
+        responses = await server.handle_lines(lines)
+        assert [r["id"] for r in responses] == [1, None, None, 3, 2]
+        assert responses[1]["error"]["code"] == JSONRPCErrorCode.PARSE_ERROR.value
+        assert responses[2]["error"]["code"] == JSONRPCErrorCode.INVALID_REQUEST.value
+        assert responses[3]["error"]["code"] == JSONRPCErrorCode.INTERNAL_ERROR.value
+        assert "result" in responses[0] and "result" in responses[4]
+        assert server._encode_response(responses[1]) == json.dumps(responses[1])
+
     @pytest.mark.asyncio
     async def test_handle_tools_call_analyze(self) -> None:
         """Verify analyze_functions tool executes and returns content."""
@@ -73,8 +121,40 @@ class TestDocScopeMCPServer:
                 {"name": "analyze_functions", "arguments": {}},
                 JSONRPCErrorCode.INVALID_PARAMS,
             ),
+            (
+                "tools/call",
+                {"name": "analyze_functions", "arguments": {"code": ["def f(): pass"]}},
+                JSONRPCErrorCode.INVALID_PARAMS,
+            ),
+            (
+                "tools/call",
+                {
+                    "name": "analyze_functions",
+                    "arguments": {"code": "def f(): pass", "file_path": ["a.py"]},
+                },
+                JSONRPCErrorCode.INVALID_PARAMS,
+            ),
+            (
+                "tools/call",
+                {
+                    "name": "analyze_functions",
+                    "arguments": {"code": "def f(): pass", "file_path": {"p": "a.py"}},
+                },
+                JSONRPCErrorCode.INVALID_PARAMS,
+            ),
+            (["initialize"], None, JSONRPCErrorCode.METHOD_NOT_FOUND),
+            ("tools/call", {"name": ["analyze_functions"]}, JSONRPCErrorCode.METHOD_NOT_FOUND),
+        ],
+        ids=[
+            "unknown_method",
+            "unknown_tool",
+            "missing_code_param",
+            "non_string_code",
+            "list_file_path",
+            "object_file_path",
+            "unhashable_method",
+            "unhashable_tool",
         ],
-        ids=["unknown_method", "unknown_tool", "missing_code_param"],
     )
     async def test_error_responses(
         self, method: str, params: dict | None, expected_error_code: JSONRPCErrorCode
@@ -200,6 +280,24 @@ class TestServerAnalysisEdgeCases:
         assert "error" in response
         assert "too large" in response["error"]["message"].lower()
 
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(signal, "SIGALRM"), reason="SIGALRM not available")
+    async def test_parse_timeout_fires_through_server(self) -> None:
+        """Verify the analyzer's SIGALRM parse timeout still applies to tools/call."""
+        from docscope_mcp.models import AnalysisConfig
+
+        server = DocScopeMCPServer(config=AnalysisConfig(ast_parse_timeout=1))
+        message = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": "analyze_functions", "arguments": {"code": "def f(): pass"}},
+        }
+        with patch("docscope_mcp.analyzers.python.analyzer.ast.parse", lambda _: time.sleep(5)):
+            response = await server.handle_message(message)
+        assert response["error"]["code"] == JSONRPCErrorCode.INTERNAL_ERROR.value
+        assert "Parse timeout" in response["error"]["message"]
+
     @pytest.mark.asyncio
     async def test_analyzer_error_returns_internal_error(self) -> None:
         """Verify analyzer errors are returned as INTERNAL_ERROR."""
@@ -217,8 +315,6 @@ class TestServerAnalysisEdgeCases:
     @pytest.mark.asyncio
     async def test_unexpected_exception_returns_internal_error(self) -> None:
         """Verify unexpected exceptions are caught and returned as INTERNAL_ERROR."""
-        from unittest.mock import patch
-
         server = DocScopeMCPServer()
         with patch.object(
             server.analyzers["python"], "analyze", side_effect=RuntimeError("Unexpected failure")
@@ -233,3 +329,80 @@ class TestServerAnalysisEdgeCases:
         assert "error" in response
         assert response["error"]["code"] == JSONRPCErrorCode.INTERNAL_ERROR.value
         assert "Unexpected failure" in response["error"]["message"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_code_reuses_cached_report(self) -> None:
+        """Verify resubmitted code is answered from cache without re-analysis."""
+        server = DocScopeMCPServer()
+        message = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": "analyze_functions", "arguments": {"code": "def f(): pass"}},
+        }
+        first = await server.handle_message(message)
+        analyzer = server.analyzers["python"]
+        with patch.object(analyzer, "analyze", wraps=analyzer.analyze) as spy:
+            second = await server.handle_message({**message, "id": 2})
+            message["params"]["arguments"]["code"] = "def g(): pass"  # type: ignore[index]
+            await server.handle_message(message)
+        assert second["id"] == 2
+        assert second["result"] == first["result"]
+        assert spy.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_process_pool_analysis_matches_in_process(self) -> None:
+        """Verify pooled analysis returns the same report as in-process analysis."""
+        from docscope_mcp.models import DEFAULT_CONFIG, AnalysisConfig
+
+        thresholds = {**DEFAULT_CONFIG.quality_thresholds, "excellent": 0.95}
+        config = AnalysisConfig(max_results_display=1, quality_thresholds=thresholds)
+        message = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {
+                "name": "analyze_functions",
+                "arguments": {"code": "def f(x):\n    return x\n\ndef g(): pass\n"},
+            },
+        }
+        expected = await DocScopeMCPServer(config=config).handle_message(message)
+        server = DocScopeMCPServer(config=config, analysis_processes=1)
+        try:
+            assert await server.handle_message(message) == expected
+        finally:
+            server.close()
+
+    def test_stdio_blocking_restored(self) -> None:
+        """Verify saved descriptor blocking modes are restored and forgotten."""
+        import os
+
+        read_fd, write_fd = os.pipe()
+        try:
+            server = DocScopeMCPServer()
+            with open(write_fd, "wb", closefd=False) as stream:
+                server._save_blocking(stream)
+            server._save_blocking(object())
+            os.set_blocking(write_fd, False)
+            server._restore_stdio_blocking()
+            assert os.get_blocking(write_fd)
+            assert server._stdio_blocking == {}
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(None, 0), ("", 0), ("2", 2), (" 3 ", 3), ("-1", 0), ("many", 0)],
+    )
+    def test_analysis_processes_from_env(
+        self, monkeypatch: pytest.MonkeyPatch, value: str | None, expected: int
+    ) -> None:
+        """Verify DOCSCOPE_ANALYSIS_PROCESSES parsing, ignoring invalid values."""
+        from docscope_mcp.server import _analysis_processes_from_env
+
+        if value is None:
+            monkeypatch.delenv("DOCSCOPE_ANALYSIS_PROCESSES", raising=False)
+        else:
+            monkeypatch.setenv("DOCSCOPE_ANALYSIS_PROCESSES", value)
+        assert _analysis_processes_from_env() == expected